@@ -1,6 +1,7 @@
 import logging
 from fastapi import FastAPI, HTTPException, Body, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, field_validator
 from typing import Dict, List, Any, Optional, Union
@@ -43,6 +44,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 es_service = ElasticsearchService(host=HOST, port=PORT)
 search_service = ArticleSearchService(host=HOST, port=PORT)
@@ -358,6 +360,7 @@ async def get_author_publications(
     size: int = Body(100, embed=True),
     from_: int = Body(0, embed=True),
     filters: Optional[Dict[str, Any]] = Body(None, embed=True),
+    lite: bool = Body(False, embed=True),
 ):
 
     try:
@@ -372,7 +375,11 @@ async def get_author_publications(
         )
 
         publications = search_service.get_author_publications(
-            author_id=author_id, size=actual_size, from_=from_, filters=filters
+            author_id=author_id,
+            size=actual_size,
+            from_=from_,
+            filters=filters,
+            lite=lite,
         )
 
         execution_time = time.time() - start_time
@@ -399,6 +406,41 @@ async def get_author_publications(
         )
 
 
+@app.get("/api/author_publications", tags=["Authors"])
+async def get_author_publications_page(
+    author_id: str, cursor: Optional[str] = None, size: int = 500, lite: bool = True
+):
+
+    try:
+        start_time = time.time()
+
+        page = search_service.get_author_publications_page(
+            author_id=author_id, size=size, cursor=cursor, lite=lite
+        )
+        publications = page["hits"]
+
+        execution_time = time.time() - start_time
+
+        logger.info(
+            f"Retrieved page of {len(publications)}/{page['total']} for author {author_id} in {execution_time:.2f}s"
+        )
+
+        return {
+            "publications": publications,
+            "total": page["total"],
+            "author_id": author_id,
+            "next_cursor": page["next_cursor"],
+            "execution_time": f"{execution_time:.2f}s",
+        }
+
+    except Exception as e:
+        logger.error(f"Error retrieving author publications page: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving author publications: {str(e)}",
+        )
+
+
 @app.post("/api/author_coauthors", tags=["Authors"])
 async def get_author_coauthors(author_id=Body(..., embed=True)):
 
@@ -414,15 +456,17 @@ async def get_author_coauthors(author_id=Body(..., embed=True)):
         if not coauthors:
             return {"coauthors": [], "total": 0, "author_id": author_id}
         coauthor_details = []
-        for caid in coauthors:
-            try:
-                response = es_service.session.get(
-                    f"{es_service.url}/{es_service.author_index}/_doc/{caid}"
-                )
-                if response.status_code == 200:
-                    coauthor_details.append(response.json().get("_source", {}))
-            except:
-                continue
+        response = es_service.session.post(
+            f"{es_service.url}/{es_service.author_index}/_mget",
+            json={"ids": list(coauthors)},
+            timeout=10,
+        )
+        if response.status_code == 200:
+            coauthor_details = [
+                doc.get("_source", {})
+                for doc in response.json().get("docs", [])
+                if doc.get("found", False)
+            ]
         return {
             "coauthors": coauthor_details,
             "total": len(coauthor_details),
@@ -1,3 +1,5 @@
+import base64
+import json
 import logging
 import re
 import requests
@@ -8,6 +10,18 @@ from typing import Optional, List, Dict, Any
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
+LITE_SOURCE_EXCLUDES = [
+    "title_embedding",
+    "abstract_embedding",
+    "keywords_embedding",
+    "combined_embedding",
+    "combined_content",
+    "references",
+    "full_text",
+]
+
+AUTHOR_PAGE_KEEP_ALIVE = "2m"
+
 
 class ArticleSearchService:
     def __init__(
@@ -645,6 +659,7 @@ class ArticleSearchService:
         size: Optional[int] = None,
         from_: int = 0,
         filters: Optional[dict] = None,
+        lite: bool = False,
     ) -> List[dict]:
 
         try:
@@ -678,25 +693,109 @@ class ArticleSearchService:
                     size,
                     len(publication_ids),
                 )
-                return self._scroll_by_author(author_id, filters)
+                return self._scroll_by_author(author_id, filters, lite)
 
             if fetch_all:
-                return self._scroll_by_author(author_id, filters)
+                return self._scroll_by_author(author_id, filters, lite)
 
             if has_id_list:
-                return self._fetch_subset_by_ids(publication_ids, size, from_, filters)
+                return self._fetch_subset_by_ids(
+                    publication_ids, size, from_, filters, lite
+                )
 
-            return self._paged_search(author_id, size, from_, filters)
+            return self._paged_search(author_id, size, from_, filters, lite)
         except Exception as exc:
             logger.error("get_author_publications failed: %s", exc, exc_info=True)
             return []
 
+    def get_author_publications_page(
+        self,
+        author_id: str,
+        size: int,
+        cursor: Optional[str] = None,
+        lite: bool = False,
+    ) -> dict:
+        """One page of an author's publications, newest first.
+
+        Pages are read with ``search_after`` under a point in time, so deep
+        pages are not limited by ``index.max_result_window``. ``cursor`` is the
+        opaque ``next_cursor`` of the previous page; it is ``None`` once the
+        last page has been returned. Elasticsearch failures are raised.
+        """
+        if cursor:
+            state = json.loads(base64.urlsafe_b64decode(cursor))
+        else:
+            state = {"pit": self._open_pit(), "after": None, "loaded": 0}
+
+        body: Dict[str, Any] = {
+            "size": size,
+            "query": {"term": {"authors": author_id}},
+            "sort": [{"publication_year": {"order": "desc"}}, "_shard_doc"],
+            "pit": {"id": state["pit"], "keep_alive": AUTHOR_PAGE_KEEP_ALIVE},
+            "track_total_hits": state["after"] is None,
+        }
+        if state["after"] is not None:
+            body["search_after"] = state["after"]
+        if lite:
+            body["_source"] = {"excludes": LITE_SOURCE_EXCLUDES}
+
+        r = requests.post(f"{self.base_url}/_search", json=body, timeout=60)
+        if r.status_code == 404 and state["after"] is not None:
+            # The point in time expired; the sort values still resume the walk.
+            state["pit"] = body["pit"]["id"] = self._open_pit()
+            r = requests.post(f"{self.base_url}/_search", json=body, timeout=60)
+        if r.status_code != 200:
+            raise RuntimeError(f"author page search failed: {r.text}")
+        data = r.json()
+        hits = data.get("hits", {})
+        page = hits.get("hits", [])
+        total = state.get("total") or hits.get("total", {}).get("value", 0)
+        loaded = state["loaded"] + len(page)
+
+        next_cursor = None
+        if page and len(page) == size and loaded < total:
+            next_cursor = base64.urlsafe_b64encode(
+                json.dumps(
+                    {
+                        "pit": data.get("pit_id", state["pit"]),
+                        "after": page[-1]["sort"],
+                        "loaded": loaded,
+                        "total": total,
+                    }
+                ).encode()
+            ).decode()
+        else:
+            self._close_pit(data.get("pit_id", state["pit"]))
+
+        return {
+            "hits": [h["_source"] for h in page],
+            "total": total,
+            "next_cursor": next_cursor,
+        }
+
+    def _open_pit(self) -> str:
+        r = requests.post(
+            f"{self.base_url}/{self.index}/_pit",
+            params={"keep_alive": AUTHOR_PAGE_KEEP_ALIVE},
+            timeout=10,
+        )
+        if r.status_code != 200:
+            raise RuntimeError(f"opening point in time failed: {r.text}")
+        return r.json()["id"]
+
+    def _close_pit(self, pit_id: str) -> None:
+        try:
+            requests.delete(f"{self.base_url}/_pit", json={"id": pit_id}, timeout=10)
+        except Exception:
+            pass
+
     def _fetch_subset_by_ids(
         self,
         id_list: List[str],
         size: int,
         offset: int,
         filters: Optional[dict],
+        lite: bool = False,
     ) -> List[dict]:
         start, end = max(0, offset), offset + size
         batch_ids = id_list[start:end]
@@ -704,6 +803,8 @@ class ArticleSearchService:
         if filters:
             query = {"bool": {"must": [query], "filter": self._build_filters(filters)}}
         body = {"size": len(batch_ids), "query": query}
+        if lite:
+            body["_source"] = {"excludes": LITE_SOURCE_EXCLUDES}
         r = requests.post(
             f"{self.base_url}/{self.index}/_search", json=body, timeout=60
         )
@@ -718,6 +819,7 @@ class ArticleSearchService:
         size: int,
         offset: int,
         filters: Optional[dict],
+        lite: bool = False,
     ) -> List[dict]:
         q: Dict[str, Any] = {"term": {"authors": author_id}}
         if filters:
@@ -728,6 +830,8 @@ class ArticleSearchService:
             "query": q,
             "sort": [{"publication_year": {"order": "desc"}}],
         }
+        if lite:
+            body["_source"] = {"excludes": LITE_SOURCE_EXCLUDES}
         r = requests.post(
             f"{self.base_url}/{self.index}/_search", json=body, timeout=60
         )
@@ -736,12 +840,16 @@ class ArticleSearchService:
             return []
         return [h["_source"] for h in r.json().get("hits", {}).get("hits", [])]
 
-    def _scroll_by_author(self, author_id: str, filters: Optional[dict]) -> List[dict]:
+    def _scroll_by_author(
+        self, author_id: str, filters: Optional[dict], lite: bool = False
+    ) -> List[dict]:
         all_pubs: List[dict] = []
         query: Dict[str, Any] = {"term": {"authors": author_id}}
         if filters:
             query = {"bool": {"must": [query], "filter": self._build_filters(filters)}}
         body = {"size": 1000, "query": query, "sort": ["_doc"]}
+        if lite:
+            body["_source"] = {"excludes": LITE_SOURCE_EXCLUDES}
         try:
             init = requests.post(
                 f"{self.base_url}/{self.index}/_search?scroll=2m", json=body, timeout=60
@@ -1,14 +1,33 @@
 import os
-import json
+import orjson
 import requests
 import dash
-from dash import dcc, html, callback, Input, Output, State, ALL
+import diskcache
+from dash import dcc, html, callback, clientside_callback, Input, Output, State, ALL, DiskcacheManager
 from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
+import plotly.io as pio
+from flask import Response
+from flask_compress import Compress
+
+pio.json.config.default_engine = "orjson"
 
 API_URL = os.environ.get("API_URL", "http://localhost:8000")
+CACHE_DIR = os.environ.get("DASH_CACHE_DIR", "./cache")
+
+background_callback_manager = DiskcacheManager(diskcache.Cache(CACHE_DIR))
+
+
+class CachedLayoutDash(dash.Dash):
+    _layout_json = None
+
+    def serve_layout(self):
+        if self._layout_json is None:
+            self._layout_json = pio.json.to_json_plotly(self.layout)
+        return Response(self._layout_json, mimetype="application/json")
+
 
-app = dash.Dash(
+app = CachedLayoutDash(
     __name__,
     external_stylesheets=[
         dbc.themes.BOOTSTRAP,
@@ -17,13 +36,20 @@ app = dash.Dash(
     ],
     meta_tags=[{"name": "viewport", "content": "width=device-width, initial-scale=1"}],
     suppress_callback_exceptions=True,
+    background_callback_manager=background_callback_manager,
 )
 
 server = app.server
+Compress(server)
 app.title = "Scientific Article Search & Clustering System"
 
-from components.search_panel import create_search_panel
-from components.results_panel import create_results_panel
+from components.search_panel import PUBLICATION_TYPES_SET, SEARCH_PANEL
+from components.results_panel import (
+    PAGE_SIZE,
+    create_results_panel,
+    create_results_page,
+    register_results_callbacks,
+)
 from components.cluster_panel import create_cluster_panel
 from components.author_panel import create_author_panel, register_author_callbacks
 from components.academic_units import create_academic_units_panel, register_unit_callbacks
@@ -104,7 +130,7 @@ app.layout = dbc.Container(
                 dbc.Tabs(
                     [
                         dbc.Tab(
-                            create_search_panel(),
+                            SEARCH_PANEL,
                             label="Search",
                             tab_id="tab-search",
                             label_class_name="fw-bold",
@@ -191,17 +217,18 @@ app.layout = dbc.Container(
     Output("pagination-store", "data", allow_duplicate=True),
     Input("search-button", "n_clicks"),
     State("search-input", "value"),
-    State("search-method-select", "value"),
-    State("search-size-slider", "value"),
-    State("year-range-slider", "value"),
-    State("publication-type-select", "value"),
+    State("search-params-store", "data"),
     State("advanced-filters-store", "data"),
     prevent_initial_call=True,
 )
-def search_articles(n_clicks, query, search_method, size, year_range, pub_types, advanced_filters):
+def search_articles(n_clicks, query, search_params, advanced_filters):
     if not n_clicks or not query:
         raise PreventUpdate
     
+    search_method = search_params["search_method"]
+    size = search_params["size"]
+    year_range = search_params["year_range"]
+    pub_types = search_params["pub_types"]
     
     try:
         filters = {}
@@ -210,7 +237,9 @@ def search_articles(n_clicks, query, search_method, size, year_range, pub_types,
             filters["publication_year"] = {"gte": year_range[0], "lte": year_range[1]}
 
         if pub_types and "all" not in pub_types:
-            filters["publication_type"] = pub_types
+            pub_types = [pt for pt in pub_types if pt in PUBLICATION_TYPES_SET]
+            if pub_types:
+                filters["publication_type"] = pub_types
 
         if advanced_filters:
             for k, v in advanced_filters.items():
@@ -266,7 +295,7 @@ def search_articles(n_clicks, query, search_method, size, year_range, pub_types,
             f"Found {len(all_hits)} articles matching '{query}'", "Search Results", True
         )
         
-        pagination_data = {"page": 1, "total_pages": (len(all_hits) + 9) // 10}
+        pagination_data = {"page": 1, "total_pages": -(-len(all_hits) // PAGE_SIZE)}
         
         return results, results_panel, notification, header, is_open, False, pagination_data
         
@@ -401,28 +430,39 @@ def enable_cluster_button(search_results):
     
     return False, f"Ready to cluster {len(hits)} articles"
 
-@callback(
+clientside_callback(
+    """
+    function(helpClicks, closeClicks, isOpen) {
+        const triggered = window.dash_clientside.callback_context.triggered;
+        if (!triggered.length) {
+            return window.dash_clientside.no_update;
+        }
+        const buttonId = triggered[0].prop_id.split(".")[0];
+        if (buttonId === "help-button" && helpClicks) {
+            return true;
+        }
+        if (buttonId === "close-help-modal" && closeClicks) {
+            return false;
+        }
+        return isOpen;
+    }
+    """,
     Output("help-modal", "is_open"),
     Input("help-button", "n_clicks"),
     Input("close-help-modal", "n_clicks"),
     State("help-modal", "is_open"),
     prevent_initial_call=True,
 )
-def toggle_help_modal(help_clicks, close_clicks, is_open):
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        raise PreventUpdate
-        
-    button_id = ctx.triggered[0]["prop_id"].split(".")[0]
-    
-    if button_id == "help-button" and help_clicks:
-        return True
-    elif button_id == "close-help-modal" and close_clicks:
-        return False
-    
-    return is_open
 
-@callback(
+clientside_callback(
+    """
+    function() {
+        if (!window.dash_clientside.callback_context.triggered.length) {
+            return window.dash_clientside.no_update;
+        }
+        return true;
+    }
+    """,
     Output("loading-modal", "is_open", allow_duplicate=True),
     Input("search-button", "n_clicks"),
     Input("cluster-button", "n_clicks"),
@@ -432,24 +472,20 @@ def toggle_help_modal(help_clicks, close_clicks, is_open):
     Input("topic-analysis-button-unit", "n_clicks"),
     prevent_initial_call=True,
 )
-def show_loading_on_action(search_clicks, cluster_clicks, author_id_clicks, author_name_clicks, 
-                           unit_search_clicks, topic_analysis_clicks):
-    ctx = dash.callback_context
-    
-    if not ctx.triggered:
-        raise PreventUpdate
-    
-    return True
 
-@callback(
+clientside_callback(
+    """
+    function(trigger) {
+        if (trigger === "close_modal") {
+            return false;
+        }
+        return window.dash_clientside.no_update;
+    }
+    """,
     Output("article-detail-modal", "is_open", allow_duplicate=True),
     Input("modal-close-trigger", "data"),
     prevent_initial_call=True,
 )
-def close_modal_on_author_select(trigger):
-    if trigger == "close_modal":
-        return False
-    raise PreventUpdate
 
 @callback(
     Output("tabs", "active_tab"),
@@ -473,32 +509,19 @@ def toggle_search_params(n_clicks, is_open):
     return is_open
 
 @app.callback(
-    Output("results-container", "children", allow_duplicate=True),
+    Output("results-data", "data"),
+    Output("result-info", "children"),
+    Output("results-page-label", "children"),
+    Output("results-first-page", "style"),
     Input("results-pagination", "active_page"),
     State("search-results-store", "data"),
-    State("pagination-store", "data"),
     prevent_initial_call=True,
 )
-def change_page(page_number, search_results, pagination_data):
+def change_page(page_number, search_results):
     if not page_number or not search_results or "hits" not in search_results:
         raise PreventUpdate
     
-    hits = search_results.get("hits", [])
-    facets = search_results.get("facets", {})
-    
-    start_idx = (page_number - 1) * 10
-    end_idx = min(start_idx + 10, len(hits))
-    
-    current_page_hits = hits[start_idx:end_idx]
-    
-    results_panel = create_results_panel(
-        hits=current_page_hits, 
-        facets=facets, 
-        current_page=page_number,
-        total_hits=len(hits)
-    )
-    
-    return results_panel
+    return create_results_page(search_results.get("hits", []), page_number)
 
 @app.callback(
     Output("article-detail-modal", "is_open"),
@@ -519,11 +542,11 @@ def open_article_detail(n_clicks, search_results, author_data, unit_data, cluste
     if not any(x is not None and x > 0 for x in n_clicks):
         raise PreventUpdate
     
-    button_id = ctx.triggered[0]["prop_id"].split(".")[0]
+    button_id = ctx.triggered[0]["prop_id"].rsplit(".", 1)[0]
     article_id = None
     
     try:
-        button_data = json.loads(button_id)
+        button_data = orjson.loads(button_id)
         article_id = button_data.get("id")
     except:
         raise PreventUpdate
@@ -585,16 +608,17 @@ def open_article_detail(n_clicks, search_results, author_data, unit_data, cluste
     
     return True, title, content
 
-@callback(
+clientside_callback(
+    """
+    function(nClicks, isOpen) {
+        return nClicks ? false : isOpen;
+    }
+    """,
     Output("article-detail-modal", "is_open", allow_duplicate=True),
     Input("close-article-detail-modal", "n_clicks"),
     State("article-detail-modal", "is_open"),
     prevent_initial_call=True,
 )
-def close_article_detail_modal(n_clicks, is_open):
-    if n_clicks:
-        return False
-    return is_open
 
 @callback(
     Output("points-info-collapse", "is_open"),
@@ -827,6 +851,7 @@ def display_cluster_details(cluster_id, clustering_results):
 
 register_unit_callbacks(app)
 register_author_callbacks(app)
+register_results_callbacks(app)
 
 if __name__ == "__main__":
     app.run(debug=True, host="0.0.0.0", port=8050)
\ No newline at end of file
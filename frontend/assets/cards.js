@@ -0,0 +1,91 @@
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    cards: (function () {
+        const html = (type, props) => ({
+            namespace: "dash_html_components",
+            type: type,
+            props: props,
+        });
+        const dbc = (type, props) => ({
+            namespace: "dash_bootstrap_components",
+            type: type,
+            props: props,
+        });
+        const badge = (text, color, className, extra) =>
+            dbc("Badge", Object.assign({
+                children: text,
+                color: color,
+                className: className,
+            }, extra || {}));
+        const labelled = (label, children, className) =>
+            html("P", {
+                children: [
+                    html("Strong", {children: label}),
+                    html("Span", {children: children}),
+                ],
+                className: className,
+            });
+
+        return {
+            html: html,
+            dbc: dbc,
+            badge: badge,
+
+            authorsRow: function (authors, authorCount) {
+                const links = [];
+                authors.forEach((author, i) => {
+                    if (i > 0) {
+                        links.push(", ");
+                    }
+                    links.push(html("A", {
+                        children: author.name,
+                        id: {type: "author-link", id: author.id},
+                        href: "#",
+                        className: "text-primary",
+                        style: {cursor: "pointer", textDecoration: "none"},
+                    }));
+                });
+                if (authorCount > authors.length) {
+                    links.push(` +${authorCount - authors.length} more`);
+                }
+                return labelled("Authors: ", links, "mb-2");
+            },
+
+            keywordsRow: function (keywords, keywordCount, className, moreColor) {
+                const badges = keywords.map((kw) =>
+                    badge(kw, "light", className, {text_color: "dark"})
+                );
+                if (keywordCount > keywords.length) {
+                    badges.push(badge(
+                        `+${keywordCount - keywords.length} more`,
+                        moreColor,
+                        className,
+                        moreColor === "light" ? {text_color: "dark"} : {}
+                    ));
+                }
+                return labelled("Keywords: ", badges);
+            },
+
+            detailsButton: function (articleId) {
+                return html("Div", {
+                    children: dbc("Button", {
+                        children: "View Details",
+                        id: {type: "article-card", id: articleId},
+                        color: "primary",
+                        outline: true,
+                        size: "sm",
+                        className: "mt-2",
+                        n_clicks: 0,
+                    }),
+                    className: "text-end",
+                });
+            },
+
+            card: function (body, className) {
+                return dbc("Card", {
+                    children: [dbc("CardBody", {children: body})],
+                    className: className,
+                });
+            },
+        };
+    })(),
+});
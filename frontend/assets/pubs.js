@@ -0,0 +1,107 @@
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    pubs: {
+        appendPage: function (page, cursor, cards, pubs, pagination, nIntervals) {
+            const skip = window.dash_clientside.no_update;
+            if (!page || !cursor || page.stream !== cursor.stream
+                    || page.after !== cursor.loaded) {
+                return [skip, skip, skip, skip, skip, skip, skip];
+            }
+            if (page.error) {
+                return [
+                    Object.assign({}, cursor, {next_cursor: null}),
+                    skip, skip, skip, skip, skip, true,
+                ];
+            }
+
+            const perPage = (pagination && pagination.per_page) || 10;
+            const loaded = cursor.loaded + page.publications.length;
+            const done = page.next_cursor === null;
+
+            return [
+                Object.assign({}, cursor, {next_cursor: page.next_cursor, loaded: loaded}),
+                (cards || []).concat(page.cards),
+                (pubs || []).concat(page.publications),
+                Math.max(Math.ceil(loaded / perPage), 1),
+                loaded >= cursor.total ? null : `Loaded ${loaded}/${cursor.total} publications...`,
+                (nIntervals || 0) + 1,
+                done,
+            ];
+        },
+
+        visiblePage: function (page, cards, pagination, current) {
+            if (!cards) {
+                return [null, "No publications"];
+            }
+
+            const perPage = (pagination && pagination.per_page) || 10;
+            page = page || 1;
+            const start = (page - 1) * perPage;
+            const end = Math.min(start + perPage, cards.length);
+            const slice = cards.slice(start, end);
+            const pubIds = slice.map((card) => card.id);
+            const info = `Showing publications ${start + 1}-${end} of ${cards.length}`;
+
+            if (current && current.page === page
+                    && current.pub_ids.join("\u0000") === pubIds.join("\u0000")) {
+                return [window.dash_clientside.no_update, info];
+            }
+
+            const authorIds = [...new Set(slice.flatMap((card) => card.authors || []))];
+            return [{page: page, pub_ids: pubIds, author_ids: authorIds}, info];
+        },
+
+        renderPage: function (names, cards, pagination) {
+            if (!names || !cards) {
+                return [];
+            }
+
+            const perPage = (pagination && pagination.per_page) || 10;
+            const start = (names.page - 1) * perPage;
+
+            return window.dash_clientside.pubs.renderCards(
+                cards.slice(start, start + perPage).map((card) =>
+                    Object.assign({}, card, {
+                        authors: (card.authors || []).map((aid) => ({
+                            id: aid,
+                            name: names.names[aid] || `ID: ${aid}`,
+                        })),
+                    })
+                )
+            );
+        },
+
+        renderCards: function (cards) {
+            if (!cards) {
+                return [];
+            }
+
+            const c = window.dash_clientside.cards;
+
+            return cards.map((pub) => {
+                const body = [
+                    c.html("H5", {children: pub.title, className: "card-title"}),
+                    c.html("Div", {
+                        children: [
+                            c.badge(`Year: ${pub.year}`, "primary", "me-2"),
+                            c.badge(`Type: ${pub.type}`, "secondary", "me-2"),
+                        ],
+                        className: "mb-2",
+                    }),
+                    c.html("P", {children: pub.abstract, className: "mb-3"}),
+                ];
+
+                if (pub.authors && pub.authors.length) {
+                    body.push(c.authorsRow(pub.authors, pub.author_count));
+                }
+
+                if (pub.keywords && pub.keywords.length) {
+                    body.push(c.keywordsRow(pub.keywords, pub.keyword_count, "me-1 mb-1", "secondary"));
+                }
+
+                body.push(c.detailsButton(pub.id));
+
+                return c.card(body, "mb-3 shadow-sm publication-card");
+            });
+        },
+    },
+});
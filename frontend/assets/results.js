@@ -0,0 +1,38 @@
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    results: {
+        renderCards: function (cards) {
+            if (!cards) {
+                return [];
+            }
+
+            const c = window.dash_clientside.cards;
+
+            return cards.map((hit) => {
+                const body = [
+                    c.html("H5", {children: hit.title, className: "card-title"}),
+                    c.html("Div", {
+                        children: [
+                            c.badge(`Year: ${hit.year}`, "primary", "me-2"),
+                            c.badge(`Type: ${hit.type}`, "secondary", "me-2"),
+                            c.badge(`Score: ${hit.score}`, "light", "me-2", {text_color: "dark"}),
+                        ],
+                        className: "mb-2",
+                    }),
+                    c.html("P", {children: hit.abstract, className: "card-text"}),
+                ];
+
+                if (hit.authors && hit.authors.length) {
+                    body.push(c.authorsRow(hit.authors));
+                }
+
+                if (hit.keywords && hit.keywords.length) {
+                    body.push(c.keywordsRow(hit.keywords, hit.keyword_count, "me-1", "light"));
+                }
+
+                body.push(c.detailsButton(hit.id));
+
+                return c.card(body, "mb-3 shadow-sm result-card");
+            });
+        },
+    },
+});
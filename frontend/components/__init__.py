@@ -1,5 +1,5 @@
 from .search_panel import create_search_panel
-from .results_panel import create_results_panel
+from .results_panel import create_results_panel, register_results_callbacks
 from .cluster_panel import create_cluster_panel
 from .author_panel import create_author_panel, register_author_callbacks
 from .cluster_visualization import create_enhanced_visualization_panel
@@ -34,6 +34,7 @@ __all__ = [
     "create_affiliation_analysis_panel",
     "register_author_callbacks",
     "register_unit_callbacks",
+    "register_results_callbacks",
     "fetch_all_unit_publications",
     "extract_collaborations_from_publications",
     "resolve_author_names",
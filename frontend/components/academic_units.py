@@ -542,7 +542,9 @@ def register_unit_callbacks(app):
             notification = html.Div(
                 [
                     html.I(className="bi bi-info-circle me-2"),
-                    f"Loading data for unit {unit_name}... This may take a while if there are many publications.",
+                    html.Span(
+                        f"Loading data for unit {unit_name}... This may take a while if there are many publications."
+                    ),
                 ]
             )
 
@@ -623,7 +625,9 @@ def register_unit_callbacks(app):
             success_notification = html.Div(
                 [
                     html.I(className="bi bi-check-circle me-2"),
-                    f"Successfully loaded {unit_data.get('publication_count', 0)} publications for unit {unit_name}",
+                    html.Span(
+                        f"Successfully loaded {unit_data.get('publication_count', 0)} publications for unit {unit_name}"
+                    ),
                 ]
             )
 
@@ -1,4 +1,5 @@
 from dash import html
+from functools import lru_cache
 
 
 try:
@@ -28,6 +29,17 @@ def resolve_author_name(author_id):
     return author_name_cache[author_id]
 
 
+@lru_cache(maxsize=10_000)
+def author_link(author_id, author_name, link_type="author-link"):
+    return html.A(
+        author_name,
+        id={"type": link_type, "id": author_id},
+        href="#",
+        className="text-primary",
+        style={"cursor": "pointer", "textDecoration": "none"},
+    )
+
+
 def create_article_author_links(author_ids, className=""):
 
     if not author_ids:
@@ -51,15 +63,7 @@ def create_article_author_links(author_ids, className=""):
         else:
             author_name = f"ID: {author_id}"
 
-        author_links.append(
-            html.A(
-                author_name,
-                id={"type": "author-link", "id": author_id},
-                href="#",
-                className="text-primary",
-                style={"cursor": "pointer", "textDecoration": "none"},
-            )
-        )
+        author_links.append(author_link(author_id, author_name))
 
     return html.Span(author_links, className=className)
 
@@ -87,15 +91,7 @@ def create_article_author_links_for_modal(author_ids, className=""):
         else:
             author_name = f"ID: {author_id}"
 
-        author_links.append(
-            html.A(
-                author_name,
-                id={"type": "author-link-modal", "id": author_id},
-                href="#",
-                className="text-primary",
-                style={"cursor": "pointer", "textDecoration": "none"},
-            )
-        )
+        author_links.append(author_link(author_id, author_name, "author-link-modal"))
 
     return html.Span(author_links, className=className)
 
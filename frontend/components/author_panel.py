@@ -1,17 +1,24 @@
 import dash
-from dash import html, dcc, Input, Output, State, ALL, no_update
+from dash import html, dcc, Input, Output, State, ALL, no_update, ClientsideFunction
 from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 import requests
 import os
-import plotly.express as px
-import traceback
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.colors import qualitative
+import orjson
+import hashlib
+import logging
 import pandas as pd
+from collections import Counter
+from flask_caching import Cache
 
 try:
     from components.author_resolution_helper import (
         load_author_data,
         resolve_author_names,
+        fetch_author_publications_page,
     )
 except ImportError:
 
@@ -28,135 +35,165 @@ except ImportError:
     def resolve_author_names(author_ids, timeout=5, retry_count=2):
         return {aid: {"id": aid, "full_name": f"ID: {aid}"} for aid in author_ids}
 
+    def fetch_author_publications_page(author_id, cursor=None):
+        return {"publications": [], "total": 0, "next_cursor": None}
+
 
 API_URL = os.environ.get("API_URL", "http://localhost:8000")
 
+logger = logging.getLogger(__name__)
+
+ANALYTICS_GRAPH_CONFIG = {"staticPlot": False, "displayModeBar": False}
+
+CACHE_TIMEOUT = 300
+
+cache = Cache()
+
+CARD_ABSTRACT_MAXLEN = 300
+CARD_MAX_AUTHORS = 10
+CARD_MAX_KEYWORDS = 5
+
+PUBLICATIONS_PAGE_DELAY = 500
+PUBLICATIONS_PER_PAGE = 10
+
+
+author_panel_header = dbc.Row(
+    [
+        dbc.Col(
+            [
+                html.H3("Author Explorer", className="mb-3"),
+                html.P(
+                    "Search for authors by name or ID to explore their publications and co-authorship network.",
+                    className="text-muted",
+                ),
+            ],
+            width=12,
+        )
+    ]
+)
+
+name_search_card = dbc.Card(
+    [
+        dbc.CardHeader(
+            [
+                html.I(className="bi bi-person-badge me-2"),
+                "Search by Name",
+            ]
+        ),
+        dbc.CardBody(
+            [
+                dbc.InputGroup(
+                    [
+                        dbc.InputGroupText(
+                            [
+                                html.I(className="bi bi-search me-2"),
+                                "Name",
+                            ]
+                        ),
+                        dbc.Input(
+                            id="author-name-input",
+                            placeholder="Enter author name",
+                            type="text",
+                        ),
+                        dbc.Button(
+                            "Search",
+                            id="author-name-search-button",
+                            color="primary",
+                            n_clicks=0,
+                        ),
+                    ],
+                    className="mb-3",
+                ),
+                html.Div(id="author-name-search-results"),
+            ]
+        ),
+    ],
+    className="mb-3 shadow-sm",
+)
+
+id_search_card = dbc.Card(
+    [
+        dbc.CardHeader(
+            [
+                html.I(className="bi bi-fingerprint me-2"),
+                "Search by ID",
+            ]
+        ),
+        dbc.CardBody(
+            [
+                dbc.InputGroup(
+                    [
+                        dbc.InputGroupText(
+                            [
+                                html.I(className="bi bi-search me-2"),
+                                "ID",
+                            ]
+                        ),
+                        dbc.Input(
+                            id="author-id-input",
+                            placeholder="Enter author ID",
+                            type="text",
+                        ),
+                        dbc.Button(
+                            "Search",
+                            id="author-id-search-button",
+                            color="primary",
+                            n_clicks=0,
+                        ),
+                    ],
+                    className="mb-3",
+                ),
+            ]
+        ),
+    ],
+    className="mb-3 shadow-sm",
+)
+
 
 def create_author_panel():
     return html.Div(
         [
+            author_panel_header,
             dbc.Row(
                 [
-                    dbc.Col(
-                        [
-                            html.H3("Author Explorer", className="mb-3"),
-                            html.P(
-                                "Search for authors by name or ID to explore their publications and co-authorship network.",
-                                className="text-muted",
-                            ),
-                        ],
-                        width=12,
-                    )
+                    dbc.Col([name_search_card], width=12, md=6),
+                    dbc.Col([id_search_card], width=12, md=6),
                 ]
             ),
+            dbc.Row([dbc.Col([html.Div(id="author-info-container")], width=12)]),
             dbc.Row(
                 [
                     dbc.Col(
                         [
-                            dbc.Card(
-                                [
-                                    dbc.CardHeader(
-                                        [
-                                            html.I(className="bi bi-person-badge me-2"),
-                                            "Search by Name",
-                                        ]
-                                    ),
-                                    dbc.CardBody(
-                                        [
-                                            dbc.InputGroup(
-                                                [
-                                                    dbc.InputGroupText(
-                                                        [
-                                                            html.I(
-                                                                className="bi bi-search me-2"
-                                                            ),
-                                                            "Name",
-                                                        ]
-                                                    ),
-                                                    dbc.Input(
-                                                        id="author-name-input",
-                                                        placeholder="Enter author name",
-                                                        type="text",
-                                                    ),
-                                                    dbc.Button(
-                                                        "Search",
-                                                        id="author-name-search-button",
-                                                        color="primary",
-                                                        n_clicks=0,
-                                                    ),
-                                                ],
-                                                className="mb-3",
-                                            ),
-                                            html.Div(id="author-name-search-results"),
-                                        ]
-                                    ),
-                                ],
-                                className="mb-3 shadow-sm",
-                            )
-                        ],
-                        width=12,
-                        md=6,
-                    ),
-                    dbc.Col(
-                        [
-                            dbc.Card(
-                                [
-                                    dbc.CardHeader(
-                                        [
-                                            html.I(className="bi bi-fingerprint me-2"),
-                                            "Search by ID",
-                                        ]
-                                    ),
-                                    dbc.CardBody(
-                                        [
-                                            dbc.InputGroup(
-                                                [
-                                                    dbc.InputGroupText(
-                                                        [
-                                                            html.I(
-                                                                className="bi bi-search me-2"
-                                                            ),
-                                                            "ID",
-                                                        ]
-                                                    ),
-                                                    dbc.Input(
-                                                        id="author-id-input",
-                                                        placeholder="Enter author ID",
-                                                        type="text",
-                                                    ),
-                                                    dbc.Button(
-                                                        "Search",
-                                                        id="author-id-search-button",
-                                                        color="primary",
-                                                        n_clicks=0,
-                                                    ),
-                                                ],
-                                                className="mb-3",
-                                            ),
-                                        ]
-                                    ),
-                                ],
-                                className="mb-3 shadow-sm",
+                            html.Div(
+                                author_tabs,
+                                id="author-tabs-container",
+                                style={"display": "none"},
                             )
                         ],
                         width=12,
-                        md=6,
-                    ),
+                    )
                 ]
             ),
-            dbc.Row([dbc.Col([html.Div(id="author-info-container")], width=12)]),
             dcc.Store(
                 id="author-publications-pagination",
-                data={"page": 1, "per_page": 10, "total_publications": 0},
+                data={"page": 1, "per_page": PUBLICATIONS_PER_PAGE, "total_publications": 0},
+            ),
+            dcc.Store(id="author-publications-cursor"),
+            dcc.Store(id="author-publications-page-store"),
+            dcc.Store(id="author-publications-more-store", data=[]),
+            dcc.Store(id="author-name-search-first"),
+            dcc.Interval(
+                id="author-publications-interval",
+                interval=PUBLICATIONS_PAGE_DELAY,
+                max_intervals=0,
+                disabled=True,
             ),
         ]
     )
 
 
 def create_improved_publication_types_chart(types_data):
-    import plotly.express as px
-    import pandas as pd
-
     df = pd.DataFrame(types_data)
 
     if "type" not in df.columns or "count" not in df.columns:
@@ -166,42 +203,43 @@ def create_improved_publication_types_chart(types_data):
 
     df["percentage"] = (df["count"] / total * 100).round(1)
 
-    if len(df) > 5:
-        top_5 = df.nlargest(5, "count")
-        other_sum = df.iloc[5:]["count"].sum()
-        other_pct = df.iloc[5:]["percentage"].sum()
-
-        other_row = pd.DataFrame(
-            [{"type": "pozostałe", "count": other_sum, "percentage": other_pct}]
-        )
-
-        df = pd.concat([top_5, other_row], ignore_index=True)
-
-    df["hover_text"] = df.apply(
-        lambda x: f"{x['type']}: {x['count']} ({x['percentage']}%)", axis=1
-    )
-
-    df = df.sort_values("count", ascending=False)
+    df = df.sort_values("count", ascending=False, ignore_index=True)
 
-    fig = px.pie(
-        df,
-        values="count",
-        names="type",
-        title="Publication Types",
-        template="plotly_white",
-        hover_data=["hover_text"],
-        color_discrete_sequence=px.colors.qualitative.Plotly,
+    if len(df) > 5:
+        other_sum, other_pct = df.iloc[5:][["count", "percentage"]].sum()
+
+        df = df.iloc[:5].copy()
+        df.loc[len(df)] = {
+            "type": "pozostałe",
+            "count": int(other_sum),
+            "percentage": round(other_pct, 1),
+        }
+
+    df["hover_text"] = (
+        df["type"].astype(str)
+        + ": "
+        + df["count"].astype(str)
+        + " ("
+        + df["percentage"].astype(str)
+        + "%)"
     )
 
-    fig.update_traces(
-        textinfo="percent+label",
-        textposition="inside",
-        textfont_size=12,
-        insidetextfont=dict(color="white"),
-        hovertemplate="%{customdata[0]}<extra></extra>",
+    fig = go.Figure(
+        go.Pie(
+            labels=df["type"].tolist(),
+            values=df["count"].tolist(),
+            customdata=df["hover_text"].tolist(),
+            marker=dict(colors=qualitative.Plotly),
+            textinfo="percent+label",
+            textposition="inside",
+            textfont_size=12,
+            insidetextfont=dict(color="white"),
+            hovertemplate="%{customdata}<extra></extra>",
+        )
     )
 
     fig.update_layout(
+        title="Publication Types",
         height=500,
         margin=dict(l=10, r=10, t=40, b=100),
         legend=dict(
@@ -217,115 +255,89 @@ def create_improved_publication_types_chart(types_data):
     return fig
 
 
-def create_publication_cards(publications):
-    from components.author_link_component import create_article_author_links
+def serialize_publication_cards(publications):
+    pub_authors = [
+        [authors] if isinstance(authors, str) else authors
+        for authors in (pub.get("authors") or [] for pub in publications)
+    ]
 
     cards = []
 
-    for pub in publications:
-        article_id = pub.get("id", "")
-        title = pub.get("title", "Untitled")
-        year = pub.get("publication_year", "Unknown")
-        pub_type = pub.get("publication_type", "Unknown")
+    for pub, authors in zip(publications, pub_authors):
         abstract = pub.get("abstract", "No abstract available.")
         keywords = pub.get("keywords", [])
-        authors = pub.get("authors", [])
 
-        if len(abstract) > 300:
-            abstract = abstract[:297] + "..."
+        if len(abstract) > CARD_ABSTRACT_MAXLEN:
+            abstract = abstract[: CARD_ABSTRACT_MAXLEN - 3] + "..."
 
-        keyword_badges = []
-        if keywords:
-            if isinstance(keywords, list):
-                for kw in keywords[:5]:
-                    keyword_badges.append(
-                        dbc.Badge(
-                            kw, color="light", text_color="dark", className="me-1 mb-1"
-                        )
-                    )
-                if len(keywords) > 5:
-                    keyword_badges.append(
-                        dbc.Badge(
-                            f"+{len(keywords) - 5} more",
-                            color="secondary",
-                            className="me-1 mb-1",
-                        )
-                    )
-            else:
-                keyword_badges.append(
-                    dbc.Badge(
-                        keywords,
-                        color="light",
-                        text_color="dark",
-                        className="me-1 mb-1",
-                    )
-                )
+        if keywords and not isinstance(keywords, list):
+            keywords = [keywords]
+        keywords = keywords or []
 
         cards.append(
-            dbc.Card(
-                [
-                    dbc.CardBody(
-                        [
-                            html.H5(title, className="card-title"),
-                            html.Div(
-                                [
-                                    dbc.Badge(
-                                        f"Year: {year}",
-                                        color="primary",
-                                        className="me-2",
-                                    ),
-                                    dbc.Badge(
-                                        f"Type: {pub_type}",
-                                        color="secondary",
-                                        className="me-2",
-                                    ),
-                                ],
-                                className="mb-2",
-                            ),
-                            html.P(abstract, className="mb-3"),
-                            (
-                                html.P(
-                                    [
-                                        html.Strong("Authors: "),
-                                        create_article_author_links(authors),
-                                    ],
-                                    className="mb-2",
-                                )
-                                if authors
-                                else None
-                            ),
-                            (
-                                html.P(
-                                    [
-                                        html.Strong("Keywords: "),
-                                        html.Span(keyword_badges),
-                                    ]
-                                )
-                                if keywords
-                                else None
-                            ),
-                            html.Div(
-                                dbc.Button(
-                                    "View Details",
-                                    id={"type": "article-card", "id": article_id},
-                                    color="primary",
-                                    outline=True,
-                                    size="sm",
-                                    className="mt-2",
-                                    n_clicks=0,
-                                ),
-                                className="text-end",
-                            ),
-                        ]
-                    )
-                ],
-                className="mb-3 shadow-sm",
-            )
+            {
+                "id": pub.get("id", ""),
+                "title": pub.get("title", "Untitled"),
+                "year": pub.get("publication_year", "Unknown"),
+                "type": pub.get("publication_type", "Unknown"),
+                "abstract": abstract,
+                "keywords": keywords[:CARD_MAX_KEYWORDS],
+                "keyword_count": len(keywords),
+                "authors": authors[:CARD_MAX_AUTHORS],
+                "author_count": len(authors),
+            }
         )
 
     return cards
 
 
+COAUTHOR_COL_KWARGS = {"width": 12, "md": 6, "lg": 4, "className": "mb-3"}
+COAUTHOR_BUTTON_KWARGS = {
+    "color": "primary",
+    "outline": True,
+    "size": "sm",
+    "className": "mt-2",
+    "n_clicks": 0,
+}
+
+
+def create_coauthor_card(coauthor):
+    return dbc.Col(
+        dbc.Card(
+            [
+                dbc.CardBody(
+                    [
+                        html.H5(
+                            coauthor.get("full_name", "Unknown"), className="card-title"
+                        ),
+                        html.Div(
+                            [
+                                html.Strong("Unit: "),
+                                html.Span(coauthor.get("unit", "Not specified")),
+                            ],
+                            className="mb-2",
+                        ),
+                        html.Div(
+                            [
+                                html.Strong("Subunit: "),
+                                html.Span(coauthor.get("subunit") or "Not specified"),
+                            ],
+                            className="mb-2",
+                        ),
+                        dbc.Button(
+                            "View Profile",
+                            id={"type": "coauthor-select-button", "id": coauthor["id"]},
+                            **COAUTHOR_BUTTON_KWARGS,
+                        ),
+                    ]
+                )
+            ],
+            className="h-100 shadow-sm",
+        ),
+        **COAUTHOR_COL_KWARGS,
+    )
+
+
 def create_coauthors_content(coauthors):
     if not coauthors:
         return dbc.Alert(
@@ -334,66 +346,39 @@ def create_coauthors_content(coauthors):
             className="text-center",
         )
 
-    coauthor_cards = []
-    for i, coauthor in enumerate(coauthors):
-        if not coauthor.get("id"):
-            continue
-
-        coauthor_id = coauthor.get("id", "")
-        full_name = coauthor.get("full_name", "Unknown")
-        unit = coauthor.get("unit", "Not specified")
-        subunit = coauthor.get("subunit", "Not specified")
+    unresolved_ids = [
+        c["id"]
+        for c in coauthors
+        if c.get("id") and c.get("full_name", f"ID: {c['id']}") == f"ID: {c['id']}"
+    ]
+    if unresolved_ids:
+        resolved = resolve_author_names(unresolved_ids)
+        for coauthor in coauthors:
+            details = resolved.get(coauthor.get("id"))
+            if details:
+                coauthor.update(
+                    {
+                        k: details[k]
+                        for k in ("full_name", "unit", "subunit")
+                        if details.get(k)
+                    }
+                )
 
-        coauthor_cards.append(
-            dbc.Col(
-                dbc.Card(
-                    [
-                        dbc.CardBody(
-                            [
-                                html.H5(full_name, className="card-title"),
-                                html.Div(
-                                    [
-                                        html.Strong("Unit: "),
-                                        html.Span(unit),
-                                    ],
-                                    className="mb-2",
-                                ),
-                                html.Div(
-                                    [
-                                        html.Strong("Subunit: "),
-                                        html.Span(
-                                            subunit if subunit else "Not specified"
-                                        ),
-                                    ],
-                                    className="mb-2",
-                                ),
-                                dbc.Button(
-                                    "View Profile",
-                                    id={
-                                        "type": "coauthor-select-button",
-                                        "id": coauthor_id,
-                                    },
-                                    color="primary",
-                                    outline=True,
-                                    size="sm",
-                                    className="mt-2",
-                                    n_clicks=0,
-                                ),
-                            ]
-                        )
-                    ],
-                    className="h-100 shadow-sm",
-                ),
-                width=12,
-                md=6,
-                lg=4,
-                className="mb-3",
-            )
-        )
+    coauthor_cards = [
+        create_coauthor_card(coauthor) for coauthor in coauthors if coauthor.get("id")
+    ]
 
     return dbc.Row(coauthor_cards)
 
 
+def create_analytics_graph(fig):
+    fig.update_layout(template="plotly_white", uirevision="const")
+    return dcc.Graph(
+        figure=orjson.loads(pio.to_json(fig, engine="orjson")),
+        config=ANALYTICS_GRAPH_CONFIG,
+    )
+
+
 def create_analytics_content(publications):
 
     if not publications:
@@ -403,25 +388,37 @@ def create_analytics_content(publications):
             className="text-center",
         )
 
-    years = {}
-    types = {}
-    all_keywords = {}
+    cache_key = "author-analytics:" + hashlib.blake2b(
+        orjson.dumps(publications), digest_size=16
+    ).hexdigest()
+
+    content = cache.get(cache_key)
+    if content is None:
+        content = build_analytics_content(publications)
+        cache.set(cache_key, content, timeout=CACHE_TIMEOUT)
+
+    return content
+
+
+def build_analytics_content(publications):
+
+    years = Counter()
+    types = Counter()
+    all_keywords = Counter()
 
     for pub in publications:
         year = pub.get("publication_year")
         if year:
-            years[year] = years.get(year, 0) + 1
+            years[year] += 1
 
-        pub_type = pub.get("publication_type", "Unknown")
-        types[pub_type] = types.get(pub_type, 0) + 1
+        types[pub.get("publication_type", "Unknown")] += 1
 
         keywords = pub.get("keywords", [])
         if keywords:
             if isinstance(keywords, list):
-                for kw in keywords:
-                    all_keywords[kw] = all_keywords.get(kw, 0) + 1
+                all_keywords.update(keywords)
             else:
-                all_keywords[keywords] = all_keywords.get(keywords, 0) + 1
+                all_keywords[keywords] += 1
 
     summary_card = dbc.Card(
         [
@@ -460,9 +457,7 @@ def create_analytics_content(publications):
                                         [
                                             html.Strong("Most Common Type: "),
                                             html.Span(
-                                                max(types.items(), key=lambda x: x[1])[
-                                                    0
-                                                ]
+                                                types.most_common(1)[0][0]
                                                 if types
                                                 else "Unknown"
                                             ),
@@ -473,10 +468,7 @@ def create_analytics_content(publications):
                                         [
                                             html.Strong("Top Keyword: "),
                                             html.Span(
-                                                max(
-                                                    all_keywords.items(),
-                                                    key=lambda x: x[1],
-                                                )[0]
+                                                all_keywords.most_common(1)[0][0]
                                                 if all_keywords
                                                 else "None"
                                             ),
@@ -499,22 +491,22 @@ def create_analytics_content(publications):
 
     if years:
         years_items = sorted(years.items())
-        fig_years = px.bar(
-            x=[y[0] for y in years_items],
-            y=[y[1] for y in years_items],
-            labels={"x": "Year", "y": "Number of Publications"},
-            title="Publications by Year",
-            template="plotly_white",
-            color=[y[1] for y in years_items],  
-            color_continuous_scale="Viridis",  
+        years_x = [y[0] for y in years_items]
+        years_y = [y[1] for y in years_items]
+        fig_years = go.Figure(
+            go.Bar(
+                x=years_x,
+                y=years_y,
+                marker=dict(color=years_y, colorscale="Viridis", showscale=False),
+            )
         )
         fig_years.update_layout(
-            xaxis_title="Year", 
+            title="Publications by Year",
+            xaxis_title="Year",
             yaxis_title="Number of Publications",
-            coloraxis_showscale=False, 
         )
         charts.append(
-            dbc.Col(dcc.Graph(figure=fig_years), width=12, lg=6, className="mb-4")
+            dbc.Col(create_analytics_graph(fig_years), width=12, lg=6, className="mb-4")
         )
 
     if types:
@@ -524,38 +516,32 @@ def create_analytics_content(publications):
 
         if fig_types:
             charts.append(
-                dbc.Col(dcc.Graph(figure=fig_types), width=12, lg=6, className="mb-4")
+                dbc.Col(create_analytics_graph(fig_types), width=12, lg=6, className="mb-4")
             )
 
     if all_keywords:
-        top_keywords = sorted(all_keywords.items(), key=lambda x: x[1], reverse=True)[:15]
-        
-
-        keywords_df = pd.DataFrame({
-            "keyword": [k[0] for k in top_keywords],
-            "count": [k[1] for k in top_keywords]
-        })
-        
-        fig_keywords = px.bar(
-            keywords_df,
-            x="count",
-            y="keyword",
-            orientation="h",
-            labels={"count": "Count", "keyword": "Keyword"},
-            title="Top Keywords",
-            template="plotly_white",
-            color="count", 
-            color_continuous_scale="Viridis", 
+        top_keywords = all_keywords.most_common(15)
+        keywords_counts = [k[1] for k in top_keywords]
+
+        fig_keywords = go.Figure(
+            go.Bar(
+                x=keywords_counts,
+                y=[k[0] for k in top_keywords],
+                orientation="h",
+                marker=dict(
+                    color=keywords_counts, colorscale="Viridis", showscale=False
+                ),
+            )
         )
         fig_keywords.update_layout(
+            title="Top Keywords",
             xaxis_title="Count",
             yaxis_title="",
             yaxis={"categoryorder": "total ascending"},
-            coloraxis_showscale=False,  
         )
         charts.append(
             dbc.Col(
-                dcc.Graph(figure=fig_keywords), width=12, lg=6, className="mb-4"
+                create_analytics_graph(fig_keywords), width=12, lg=6, className="mb-4"
             )
         )
 
@@ -571,7 +557,177 @@ def create_analytics_content(publications):
     return html.Div([summary_card, dbc.Row(charts)])
 
 
+def create_profile_tab(author, total_pubs):
+    return dbc.Card(
+        [
+            dbc.CardHeader(
+                [html.I(className="bi bi-person-circle me-2"), "Author Profile"]
+            ),
+            dbc.CardBody(
+                [
+                    html.H4(author.get("full_name", "Unknown"), className="mb-3"),
+                    html.Div(
+                        [
+                            html.Strong("Unit: "),
+                            html.Span(author.get("unit", "Not specified")),
+                        ],
+                        className="mb-2",
+                    ),
+                    html.Div(
+                        [
+                            html.Strong("Subunit: "),
+                            html.Span(author.get("subunit", "Not specified")),
+                        ],
+                        className="mb-2",
+                    ),
+                    html.Div(
+                        [
+                            html.Strong("Total Publications: "),
+                            html.Span(str(total_pubs)),
+                        ],
+                        className="mb-2",
+                    ),
+                ]
+            ),
+        ],
+        className="mb-4 shadow-sm",
+    )
+
+
+def publications_progress(loaded, total_pubs):
+    if loaded >= total_pubs:
+        return None
+    return f"Loaded {loaded}/{total_pubs} publications..."
+
+
+def create_publications_tab(publications, total_pubs):
+    loaded = len(publications)
+    page_size = PUBLICATIONS_PER_PAGE
+    total_pages = (loaded + page_size - 1) // page_size
+
+    return dbc.Card(
+        [
+            dbc.CardHeader(
+                [
+                    html.I(className="bi bi-journal-richtext me-2"),
+                    f"Publications ({total_pubs})",
+                ]
+            ),
+            dbc.CardBody(
+                [
+                    html.Div(
+                        id="author-publications-progress",
+                        children=publications_progress(loaded, total_pubs),
+                        className="text-muted small mb-2",
+                    ),
+                    html.Div(
+                        id="author-publications-pagination-info",
+                        children=f"Showing publications 1-{min(page_size, loaded)} of {loaded}",
+                        className="text-muted mb-3",
+                    ),
+                    dcc.Store(
+                        id="author-publications-cards-store",
+                        data=serialize_publication_cards(publications),
+                    ),
+                    dcc.Store(id="author-publications-visible-store"),
+                    dcc.Store(id="author-publications-names-store"),
+                    html.Div(id="author-publications-list"),
+                    dbc.Pagination(
+                        id="author-publications-pagination-control",
+                        max_value=max(total_pages, 1),
+                        first_last=True,
+                        previous_next=True,
+                        active_page=1,
+                        fully_expanded=False, 
+                        className="mt-3 justify-content-center pagination-wrap",
+                        style={
+                            "maxWidth": "100%",
+                            "overflowX": "auto",
+                            "display": "flex" if total_pages > 1 else "none",
+                            "flexWrap": "wrap",
+                        },
+                    ),
+                ]
+            ),
+        ],
+        className="mb-4 shadow-sm",
+    )
+
+
+def create_coauthors_tab(coauthors):
+    return dbc.Card(
+        [
+            dbc.CardHeader(
+                [
+                    html.I(className="bi bi-people me-2"),
+                    f"Co-authors ({len(coauthors)})",
+                ]
+            ),
+            dbc.CardBody(create_coauthors_content(coauthors)),
+        ],
+        className="mb-4 shadow-sm",
+    )
+
+
+def create_analytics_tab(publications):
+    return dbc.Card(
+        [
+            dbc.CardHeader(
+                [html.I(className="bi bi-graph-up me-2"), "Publication Analytics"]
+            ),
+            dbc.CardBody(create_analytics_content(publications)),
+        ],
+        className="mb-4 shadow-sm",
+    )
+
+
+author_tabs = dbc.Tabs(
+    [
+        dbc.Tab(
+            html.Div(id="author-profile-tab"),
+            label="Profile",
+            tab_id="tab-profile",
+            active_label_class_name="fw-bold text-primary",
+        ),
+        dbc.Tab(
+            html.Div(id="author-publications-tab"),
+            label="Publications",
+            tab_id="tab-publications",
+            active_label_class_name="fw-bold text-primary",
+        ),
+        dbc.Tab(
+            html.Div(id="author-coauthors-tab"),
+            label="Co-authors",
+            tab_id="tab-coauthors",
+            active_label_class_name="fw-bold text-primary",
+        ),
+        dbc.Tab(
+            html.Div(id="author-analytics-tab"),
+            label="Analytics",
+            tab_id="tab-analytics",
+            active_label_class_name="fw-bold text-primary",
+        ),
+    ],
+    id="author-tabs",
+    className="mb-4",
+    active_tab="tab-profile",
+)
+
+
+def has_author_publications(author_data):
+    return bool(
+        author_data
+        and "error" not in author_data
+        and "publications" in author_data.get("publications", {})
+    )
+
+
 def register_author_callbacks(app):
+    cache.init_app(
+        app.server,
+        config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": CACHE_TIMEOUT},
+    )
+
     @app.callback(
         Output("loading-modal", "is_open", allow_duplicate=True),
         Input("current-author-store", "data"),
@@ -587,52 +743,41 @@ def register_author_callbacks(app):
         Output("modal-close-trigger", "data"),
         Input({"type": "author-link", "id": ALL}, "n_clicks"),
         Input({"type": "author-link-modal", "id": ALL}, "n_clicks"),
-        State({"type": "author-link", "id": ALL}, "id"),
-        State({"type": "author-link-modal", "id": ALL}, "id"),
         prevent_initial_call=True,
     )
-    def handle_author_link_click(clicks1, clicks2, ids1, ids2):
-        ctx = dash.callback_context
-
-        if not ctx.triggered:
+    def handle_author_link_click(clicks1, clicks2):
+        trig = dash.ctx.triggered_id
+        if trig is None:
             raise PreventUpdate
 
-        trigger_id = ctx.triggered[0]["prop_id"].split(".")[0]
-
-        if "author-link" in trigger_id and "modal" not in trigger_id:
-            if not any(click for click in clicks1 if click):
-                raise PreventUpdate
-
-            click_idx = next((i for i, c in enumerate(clicks1) if c), None)
-            if click_idx is None:
-                raise PreventUpdate
-
-            author_id = ids1[click_idx]["id"]
-
-            return "tab-authors", author_id, 1, "close_modal"
-
-        elif "author-link-modal" in trigger_id:
-            if not any(click for click in clicks2 if click):
-                raise PreventUpdate
-
-            click_idx = next((i for i, c in enumerate(clicks2) if c), None)
-            if click_idx is None:
-                raise PreventUpdate
-
-            author_id = ids2[click_idx]["id"]
+        if trig["type"] == "author-link":
+            clicks = clicks1
+        elif trig["type"] == "author-link-modal":
+            clicks = clicks2
+        else:
+            raise PreventUpdate
 
-            return "tab-authors", author_id, 1, "close_modal"
+        if next((i for i, c in enumerate(clicks) if c), None) is None:
+            raise PreventUpdate
 
-        raise PreventUpdate
+        return "tab-authors", trig["id"], 1, "close_modal"
 
     @app.callback(
         [
-            Output("current-author-store", "data", allow_duplicate=True),
-            Output("author-id-input", "value", allow_duplicate=True),
+            Output("author-name-search-first", "data"),
             Output("author-name-search-results", "children"),
         ],
         Input("author-name-search-button", "n_clicks"),
         State("author-name-input", "value"),
+        background=True,
+        running=[
+            (Output("author-name-search-button", "disabled"), True, False),
+            (
+                Output("author-name-search-results", "children"),
+                dbc.Spinner(color="primary"),
+                no_update,
+            ),
+        ],
         prevent_initial_call=True,
     )
     def search_authors_by_name(n_clicks, name):
@@ -640,7 +785,7 @@ def register_author_callbacks(app):
             raise PreventUpdate
 
         try:
-            print(f"Searching for authors matching: {name}")
+            logger.debug("Searching for authors matching: %s", name)
             response = requests.post(
                 f"{API_URL}/api/search_authors",
                 json={"query": name, "size": 20},
@@ -650,7 +795,6 @@ def register_author_callbacks(app):
 
             if response.status_code != 200:
                 return (
-                    no_update,
                     no_update,
                     dbc.Alert(
                         f"Error: {data.get('detail', 'Unknown error')}",
@@ -662,7 +806,6 @@ def register_author_callbacks(app):
 
             if not authors:
                 return (
-                    no_update,
                     no_update,
                     dbc.Alert(
                         f"No authors found matching '{name}'",
@@ -725,20 +868,11 @@ def register_author_callbacks(app):
 
             author_results = dbc.ListGroup(author_list)
 
-            first_author = authors[0]
-            first_author_id = first_author.get("id")
-
-            if first_author_id:
-                author_data = load_author_data(first_author_id)
-                return author_data, first_author_id, author_results
-
-            return no_update, no_update, author_results
+            return authors[0].get("id") or no_update, author_results
 
         except Exception as e:
-            print(f"Error searching for authors: {str(e)}")
-            print(traceback.format_exc())
+            logger.exception("Error searching for authors")
             return (
-                no_update,
                 no_update,
                 dbc.Alert(
                     f"Error searching for authors: {str(e)}",
@@ -746,6 +880,21 @@ def register_author_callbacks(app):
                 ),
             )
 
+    # The name search runs in a background process; the first match is loaded
+    # here so the author caches and coauthor prefetch stay in this process.
+    @app.callback(
+        Output("current-author-store", "data", allow_duplicate=True),
+        Output("author-id-input", "value", allow_duplicate=True),
+        Input("author-name-search-first", "data"),
+        prevent_initial_call=True,
+    )
+    def load_first_name_match(author_id):
+        if not author_id:
+            raise PreventUpdate
+
+        logger.debug("Loading data for first matching author ID: %s", author_id)
+        return load_author_data(author_id), author_id
+
     @app.callback(
         Output("current-author-store", "data", allow_duplicate=True),
         Input("author-id-search-button", "n_clicks"),
@@ -756,37 +905,36 @@ def register_author_callbacks(app):
         if not n_clicks or not author_id:
             raise PreventUpdate
 
-        print(f"Loading data for author ID: {author_id}")
+        logger.debug("Loading data for author ID: %s", author_id)
         return load_author_data(author_id)
 
     @app.callback(
         Output("current-author-store", "data", allow_duplicate=True),
         Output("author-id-input", "value", allow_duplicate=True),
         Input({"type": "author-select-button", "id": ALL}, "n_clicks"),
-        State({"type": "author-select-button", "id": ALL}, "id"),
         prevent_initial_call=True,
     )
-    def handle_author_selection(n_clicks_list, button_ids):
-        if not any(click for click in n_clicks_list if click):
+    def handle_author_selection(n_clicks_list):
+        if next((i for i, c in enumerate(n_clicks_list) if c), None) is None:
             raise PreventUpdate
 
-        ctx = dash.callback_context
-        if not ctx.triggered:
+        trig = dash.ctx.triggered_id
+        if trig is None:
             raise PreventUpdate
 
-        button_id = ctx.triggered[0]["prop_id"].split(".")[0]
-        button_data = eval(button_id)
-        author_id = button_data.get("id")
+        author_id = trig["id"]
 
         if not author_id:
             raise PreventUpdate
 
-        print(f"Loading data for selected author ID: {author_id}")
+        logger.debug("Loading data for selected author ID: %s", author_id)
         author_data = load_author_data(author_id)
         return author_data, author_id
 
     @app.callback(
         Output("author-info-container", "children"),
+        Output("author-tabs-container", "style"),
+        Output("author-tabs", "active_tab"),
         Input("current-author-store", "data"),
         prevent_initial_call=True,
     )
@@ -795,252 +943,237 @@ def register_author_callbacks(app):
             raise PreventUpdate
 
         if "error" in author_data:
-            return dbc.Alert(
-                author_data["error"],
-                color="danger",
+            return (
+                dbc.Alert(
+                    author_data["error"],
+                    color="danger",
+                ),
+                {"display": "none"},
+                no_update,
             )
 
-        if "publications" not in author_data or "publications" not in author_data.get(
-            "publications", {}
-        ):
-            return dbc.Alert(
-                "No publication data available for this author",
-                color="warning",
+        if not has_author_publications(author_data):
+            return (
+                dbc.Alert(
+                    "No publication data available for this author",
+                    color="warning",
+                ),
+                {"display": "none"},
+                no_update,
             )
 
-        author = author_data.get("author", {})
-        publications = author_data.get("publications", {}).get("publications", [])
-        coauthors = author_data.get("coauthors", {}).get("coauthors", [])
+        return None, {"display": "block"}, "tab-profile"
 
-        profile_tab = dbc.Card(
-            [
-                dbc.CardHeader(
-                    [html.I(className="bi bi-person-circle me-2"), "Author Profile"]
-                ),
-                dbc.CardBody(
-                    [
-                        html.H4(author.get("full_name", "Unknown"), className="mb-3"),
-                        html.Div(
-                            [
-                                html.Strong("Unit: "),
-                                html.Span(author.get("unit", "Not specified")),
-                            ],
-                            className="mb-2",
-                        ),
-                        html.Div(
-                            [
-                                html.Strong("Subunit: "),
-                                html.Span(author.get("subunit", "Not specified")),
-                            ],
-                            className="mb-2",
-                        ),
-                        html.Div(
-                            [
-                                html.Strong("Total Publications: "),
-                                html.Span(str(len(publications))),
-                            ],
-                            className="mb-2",
-                        ),
-                    ]
-                ),
-            ],
-            className="mb-4 shadow-sm",
+    @app.callback(
+        Output("author-profile-tab", "children"),
+        Input("current-author-store", "data"),
+        prevent_initial_call=True,
+    )
+    def update_author_profile(author_data):
+        if not has_author_publications(author_data):
+            raise PreventUpdate
+
+        return create_profile_tab(
+            author_data.get("author", {}),
+            author_data["publications"].get(
+                "total", len(author_data["publications"]["publications"])
+            ),
         )
 
-        total_pubs = len(publications)
-        page_size = 10
-        total_pages = (total_pubs + page_size - 1) // page_size
+    @app.callback(
+        Output("author-publications-tab", "children"),
+        Input("current-author-store", "data"),
+        prevent_initial_call=True,
+    )
+    def update_author_publications(author_data):
+        if not has_author_publications(author_data):
+            raise PreventUpdate
 
-        publications_tab = dbc.Card(
-            [
-                dbc.CardHeader(
-                    [
-                        html.I(className="bi bi-journal-richtext me-2"),
-                        f"Publications ({total_pubs})",
-                    ]
-                ),
-                dbc.CardBody(
-                    [
-                        dcc.Markdown(
-                            """
-                    <style>
-                    .pagination-wrap {
-                        flex-wrap: wrap !important;
-                        justify-content: center !important;
-                    }
-                    .pagination-wrap .page-item {
-                        margin: 2px !important;
-                    }
-                    .pagination-wrap .page-link {
-                        min-width: 38px !important;
-                        text-align: center !important;
-                    }
-                    </style>
-                    """,
-                            dangerously_allow_html=True,
-                        ),
-                        html.Div(
-                            id="author-publications-pagination-info",
-                            children=f"Showing publications 1-{min(page_size, total_pubs)} of {total_pubs}",
-                            className="text-muted mb-3",
-                        ),
-                        html.Div(
-                            id="author-publications-list",
-                            children=create_publication_cards(publications[:page_size]),
-                        ),
-                        (
-                            dbc.Pagination(
-                                id="author-publications-pagination-control",
-                                max_value=total_pages,
-                                first_last=True,
-                                previous_next=True,
-                                active_page=1,
-                                fully_expanded=False, 
-                                className="mt-3 justify-content-center pagination-wrap",
-                                style={
-                                    "maxWidth": "100%",
-                                    "overflowX": "auto",
-                                    "display": "flex",
-                                    "flexWrap": "wrap",
-                                },
-                            )
-                            if total_pages > 1
-                            else html.Div()
-                        ),
-                    ]
-                ),
-            ],
-            className="mb-4 shadow-sm",
+        publications = author_data["publications"]["publications"]
+        return create_publications_tab(
+            publications,
+            author_data["publications"].get("total", len(publications)),
         )
 
+    @app.callback(
+        Output("author-publications-cursor", "data"),
+        Output("author-publications-more-store", "data"),
+        Output("author-publications-interval", "max_intervals"),
+        Output("author-publications-interval", "disabled"),
+        Input("current-author-store", "data"),
+        State("author-publications-cursor", "data"),
+        State("author-publications-interval", "n_intervals"),
+        prevent_initial_call=True,
+    )
+    def start_publications_stream(author_data, cursor, n_intervals):
+        if not has_author_publications(author_data):
+            raise PreventUpdate
 
-        coauthors_tab = dbc.Card(
-            [
-                dbc.CardHeader(
-                    [
-                        html.I(className="bi bi-people me-2"),
-                        f"Co-authors ({len(coauthors)})",
-                    ]
-                ),
-                dbc.CardBody(create_coauthors_content(coauthors)),
-            ],
-            className="mb-4 shadow-sm",
+        author_pubs = author_data["publications"]
+        next_cursor = author_pubs.get("next_cursor")
+        loaded = len(author_pubs["publications"])
+        return (
+            {
+                "stream": (cursor or {}).get("stream", 0) + 1,
+                "author_id": author_pubs.get("author_id"),
+                "next_cursor": next_cursor,
+                "loaded": loaded,
+                "total": author_pubs.get("total", loaded),
+            },
+            [],
+            (n_intervals or 0) + 1,
+            next_cursor is None,
         )
 
-        analytics_tab = dbc.Card(
-            [
-                dbc.CardHeader(
-                    [html.I(className="bi bi-graph-up me-2"), "Publication Analytics"]
-                ),
-                dbc.CardBody(create_analytics_content(publications)),
-            ],
-            className="mb-4 shadow-sm",
-        )
+    # Each interval tick loads one page, and pubs.appendPage re-arms the
+    # interval only once that page has landed. Pages from a stream that was
+    # replaced by another author are dropped there.
+    @app.callback(
+        Output("author-publications-page-store", "data"),
+        Input("author-publications-interval", "n_intervals"),
+        State("author-publications-cursor", "data"),
+        prevent_initial_call=True,
+    )
+    def load_next_publications_page(n_intervals, cursor):
+        if not cursor or cursor.get("next_cursor") is None:
+            raise PreventUpdate
 
-        tabs = dbc.Tabs(
-            [
-                dbc.Tab(
-                    profile_tab,
-                    label="Profile",
-                    tab_id="tab-profile",
-                    active_label_class_name="fw-bold text-primary",
-                ),
-                dbc.Tab(
-                    publications_tab,
-                    label="Publications",
-                    tab_id="tab-publications",
-                    active_label_class_name="fw-bold text-primary",
-                ),
-                dbc.Tab(
-                    coauthors_tab,
-                    label="Co-authors",
-                    tab_id="tab-coauthors",
-                    active_label_class_name="fw-bold text-primary",
-                ),
-                dbc.Tab(
-                    analytics_tab,
-                    label="Analytics",
-                    tab_id="tab-analytics",
-                    active_label_class_name="fw-bold text-primary",
-                ),
-            ],
-            className="mb-4",
-            active_tab="tab-profile",
+        page = {"stream": cursor["stream"], "after": cursor["loaded"]}
+        try:
+            result = fetch_author_publications_page(
+                cursor["author_id"], cursor["next_cursor"]
+            )
+        except Exception:
+            logger.exception(
+                "Loading publications page after %s failed", cursor["loaded"]
+            )
+            page["error"] = True
+            return page
+
+        page.update(
+            publications=result["publications"],
+            cards=serialize_publication_cards(result["publications"]),
+            next_cursor=result["next_cursor"],
         )
+        return page
+
+    app.clientside_callback(
+        ClientsideFunction(namespace="pubs", function_name="appendPage"),
+        Output("author-publications-cursor", "data", allow_duplicate=True),
+        Output("author-publications-cards-store", "data"),
+        Output("author-publications-more-store", "data", allow_duplicate=True),
+        Output("author-publications-pagination-control", "max_value"),
+        Output("author-publications-progress", "children"),
+        Output("author-publications-interval", "max_intervals", allow_duplicate=True),
+        Output("author-publications-interval", "disabled", allow_duplicate=True),
+        Input("author-publications-page-store", "data"),
+        State("author-publications-cursor", "data"),
+        State("author-publications-cards-store", "data"),
+        State("author-publications-more-store", "data"),
+        State("author-publications-pagination", "data"),
+        State("author-publications-interval", "n_intervals"),
+        prevent_initial_call=True,
+    )
 
-        app.clientside_callback(
-            """
-            function(data) {
-                if (!data || !data.publications || !data.publications.publications) {
-                    return {"page": 1, "per_page": 10, "total_publications": 0};
-                }
-                return {"page": 1, "per_page": 10, "total_publications": data.publications.publications.length};
-            }
-            """,
-            Output("author-publications-pagination", "data", allow_duplicate=True),
-            Input("current-author-store", "data"),
-            prevent_initial_call=True,
+    @app.callback(
+        Output("author-coauthors-tab", "children"),
+        Input("current-author-store", "data"),
+        prevent_initial_call=True,
+    )
+    def update_author_coauthors(author_data):
+        if not has_author_publications(author_data):
+            raise PreventUpdate
+
+        return create_coauthors_tab(
+            author_data.get("coauthors", {}).get("coauthors", [])
         )
 
-        return tabs
+    @app.callback(
+        Output("author-analytics-tab", "children"),
+        Input("author-tabs", "active_tab"),
+        Input("current-author-store", "data"),
+        State("author-publications-more-store", "data"),
+        prevent_initial_call=True,
+    )
+    def update_author_analytics(active_tab, author_data, more_publications):
+        if active_tab != "tab-analytics" or not has_author_publications(author_data):
+            raise PreventUpdate
+
+        return create_analytics_tab(
+            author_data["publications"]["publications"] + (more_publications or [])
+        )
 
     @app.callback(
         Output("current-author-store", "data", allow_duplicate=True),
         Output("author-id-input", "value", allow_duplicate=True),
         Input({"type": "coauthor-select-button", "id": ALL}, "n_clicks"),
-        State({"type": "coauthor-select-button", "id": ALL}, "id"),
         prevent_initial_call=True,
     )
-    def handle_coauthor_selection(n_clicks_list, button_ids):
+    def handle_coauthor_selection(n_clicks_list):
         if not any(click for click in n_clicks_list if click):
             raise PreventUpdate
 
-        ctx = dash.callback_context
-        if not ctx.triggered:
+        trig = dash.ctx.triggered_id
+        if trig is None:
             raise PreventUpdate
 
-        button_id = ctx.triggered[0]["prop_id"].split(".")[0]
-        button_data = eval(button_id)
-        author_id = button_data.get("id")
+        author_id = trig["id"]
 
         if not author_id:
             raise PreventUpdate
 
-        print(f"Loading data for selected coauthor ID: {author_id}")
+        logger.debug("Loading data for selected coauthor ID: %s", author_id)
         author_data = load_author_data(author_id)
         return author_data, author_id
 
-    @app.callback(
-        Output("author-publications-list", "children"),
+    app.clientside_callback(
+        f"""
+        function(data) {{
+            if (!data || !data.publications || !data.publications.publications) {{
+                return {{"page": 1, "per_page": {PUBLICATIONS_PER_PAGE}, "total_publications": 0}};
+            }}
+            return {{"page": 1, "per_page": {PUBLICATIONS_PER_PAGE}, "total_publications": data.publications.publications.length}};
+        }}
+        """,
+        Output("author-publications-pagination", "data", allow_duplicate=True),
+        Input("current-author-store", "data"),
+        prevent_initial_call=True,
+    )
+
+    # Cards carry raw author ids; names are resolved for the visible page only.
+    app.clientside_callback(
+        ClientsideFunction(namespace="pubs", function_name="visiblePage"),
+        Output("author-publications-visible-store", "data"),
         Output("author-publications-pagination-info", "children"),
         Input("author-publications-pagination-control", "active_page"),
-        State("current-author-store", "data"),
+        Input("author-publications-cards-store", "data"),
         State("author-publications-pagination", "data"),
-        prevent_initial_call=True,
+        State("author-publications-visible-store", "data"),
     )
-    def paginate_author_publications(page, author_data, pagination_data):
-        if not page or not author_data or not pagination_data:
-            raise PreventUpdate
 
-        if "publications" not in author_data or "publications" not in author_data.get(
-            "publications", {}
-        ):
-            return html.Div("No publications data available"), "No publications"
-
-        publications = author_data.get("publications", {}).get("publications", [])
-        if not publications:
+    @app.callback(
+        Output("author-publications-names-store", "data"),
+        Input("author-publications-visible-store", "data"),
+        prevent_initial_call=True,
+    )
+    def resolve_visible_publication_authors(visible):
+        if not visible:
             raise PreventUpdate
 
-        per_page = pagination_data.get("per_page", 10)
-        start_idx = (page - 1) * per_page
-        end_idx = min(start_idx + per_page, len(publications))
-
-        current_publications = publications[start_idx:end_idx]
-
-        publication_cards = create_publication_cards(current_publications)
-
-        pagination_info = (
-            f"Showing publications {start_idx + 1}-{end_idx} of {len(publications)}"
-        )
-
-        return publication_cards, pagination_info
+        author_ids = visible["author_ids"]
+        author_data = resolve_author_names(author_ids) if author_ids else {}
+        return {
+            "page": visible["page"],
+            "names": {
+                aid: author_data.get(aid, {}).get("full_name", f"ID: {aid}")
+                for aid in author_ids
+            },
+        }
+
+    app.clientside_callback(
+        ClientsideFunction(namespace="pubs", function_name="renderPage"),
+        Output("author-publications-list", "children"),
+        Input("author-publications-names-store", "data"),
+        State("author-publications-cards-store", "data"),
+        State("author-publications-pagination", "data"),
+    )
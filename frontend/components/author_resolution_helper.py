@@ -1,60 +1,101 @@
 from __future__ import annotations
 from typing import List, Dict, Any
+import logging
 import os
 import time
+import threading
+from collections import Counter
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
+import ijson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from cachelib import SimpleCache
+from cachetools import TTLCache
 
 API_URL: str = os.environ.get("API_URL", "http://localhost:8000")
+BULK_BATCH_SIZE: int = 100
+AUTHOR_DATA_TIMEOUT: int = int(os.environ.get("AUTHOR_DATA_TIMEOUT", 600))
+AUTHOR_CACHE_SIZE: int = int(os.environ.get("AUTHOR_CACHE_SIZE", 10_000))
+AUTHOR_CACHE_TTL: int = int(os.environ.get("AUTHOR_CACHE_TTL", 3600))
+PUBLICATIONS_PAGE_SIZE: int = int(os.environ.get("PUBLICATIONS_PAGE_SIZE", 500))
+COAUTHOR_PREFETCH_COUNT: int = int(os.environ.get("COAUTHOR_PREFETCH_COUNT", 10))
 
-_author_cache: Dict[str, Dict[str, Any]] = {}
+logger = logging.getLogger(__name__)
 
+_author_data_cache = SimpleCache(threshold=500, default_timeout=AUTHOR_DATA_TIMEOUT)
+_executor = ThreadPoolExecutor(max_workers=12, thread_name_prefix="author-loader")
 
-def resolve_author_names(
-    author_ids: List[str],
-    timeout: int = 5,
-    retry_count: int = 2,
-) -> Dict[str, Dict[str, Any]]:
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.1,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+    ),
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
 
-    result: Dict[str, Dict[str, Any]] = {}
-    ids_to_fetch: List[str] = []
+_author_cache: TTLCache = TTLCache(maxsize=AUTHOR_CACHE_SIZE, ttl=AUTHOR_CACHE_TTL)
+_author_cache_lock = threading.Lock()
+_inflight: Dict[str, threading.Event] = {}
 
-    for aid in author_ids:
 
-        if aid in _author_cache and _author_cache[aid].get("full_name") != f"ID: {aid}":
-            result[aid] = _author_cache[aid]
-        else:
-            _author_cache.setdefault(aid, {"id": aid, "full_name": f"ID: {aid}"})
-            result[aid] = _author_cache[aid]
-            ids_to_fetch.append(aid)
+def _cached_author(aid: str) -> Dict[str, Any] | None:
 
-    if ids_to_fetch:
+    with _author_cache_lock:
+        cached = _author_cache.get(aid)
+    if cached and cached.get("full_name") != f"ID: {aid}":
+        return cached
+    return None
+
+
+def _cache_author(author: Dict[str, Any]) -> None:
+
+    with _author_cache_lock:
+        _author_cache[author["id"]] = author
+
+
+def _fetch_authors(
+    ids_to_fetch: List[str],
+    result: Dict[str, Dict[str, Any]],
+    timeout: int,
+    retry_count: int,
+) -> None:
+
+    for start in range(0, len(ids_to_fetch), BULK_BATCH_SIZE):
         try:
-            r = requests.post(
+            r = _session.post(
                 f"{API_URL}/api/authors_bulk",
-                json={"ids": ids_to_fetch},
+                json={"ids": ids_to_fetch[start : start + BULK_BATCH_SIZE]},
                 timeout=timeout * 2,
             )
             if r.status_code == 200:
                 for ad in r.json().get("authors", []):
                     ad.setdefault("full_name", f"ID: {ad['id']}")
-                    _author_cache[ad["id"]] = ad
+                    _cache_author(ad)
                     result[ad["id"]] = ad
-                ids_to_fetch = [
-                    i
-                    for i in ids_to_fetch
-                    if _author_cache[i].get("full_name") == f"ID: {i}"
-                ]
         except Exception:
             pass
 
+    ids_to_fetch = [
+        i for i in ids_to_fetch if result[i].get("full_name") == f"ID: {i}"
+    ]
+
     for aid in ids_to_fetch:
         for attempt in range(retry_count + 1):
             try:
-                r = requests.get(f"{API_URL}/api/authors/{aid}", timeout=timeout)
+                r = _session.get(f"{API_URL}/api/authors/{aid}", timeout=timeout)
                 if r.status_code == 200:
                     data = r.json()
                     data.setdefault("full_name", f"ID: {aid}")
-                    _author_cache[aid] = data
+                    data.setdefault("id", aid)
+                    _cache_author(data)
                     result[aid] = data
                     break
                 if r.status_code == 404:
@@ -63,20 +104,80 @@ def resolve_author_names(
                 time.sleep(0.2)
             except Exception:
                 break
+
+
+def resolve_author_names(
+    author_ids: List[str],
+    timeout: int = 5,
+    retry_count: int = 2,
+) -> Dict[str, Dict[str, Any]]:
+
+    result: Dict[str, Dict[str, Any]] = {}
+    ids_to_fetch: List[str] = []
+
+    for aid in author_ids:
+
+        cached = _cached_author(aid)
+        if cached:
+            result[aid] = cached
+        else:
+            result[aid] = {"id": aid, "full_name": f"ID: {aid}"}
+            ids_to_fetch.append(aid)
+
+    claimed: List[str] = []
+    waiting: Dict[str, threading.Event] = {}
+    with _author_cache_lock:
+        for aid in dict.fromkeys(ids_to_fetch):
+            event = _inflight.get(aid)
+            if event is None:
+                _inflight[aid] = threading.Event()
+                claimed.append(aid)
+            else:
+                waiting[aid] = event
+
+    try:
+        _fetch_authors(claimed, result, timeout, retry_count)
+    finally:
+        with _author_cache_lock:
+            for aid in claimed:
+                _inflight.pop(aid).set()
+
+    for aid, event in waiting.items():
+        event.wait(timeout * 2)
+        cached = _cached_author(aid)
+        if cached:
+            result[aid] = cached
+
     return result
 
 
-def fetch_all_author_publications(author_id: str) -> List[Dict[str, Any]]:
+def fetch_author_publications_page(
+    author_id: str, cursor: str | None = None
+) -> Dict[str, Any]:
 
-    r = requests.post(
+    # Cursors hold a short-lived point in time on the backend, so pages are
+    # not cached; the assembled author data is cached by load_author_data.
+    with _session.get(
         f"{API_URL}/api/author_publications",
-        json={"author_id": author_id, "size": 0, "lite": True},
-        timeout=300,
+        params={
+            "author_id": author_id,
+            "cursor": cursor,
+            "size": PUBLICATIONS_PAGE_SIZE,
+            "lite": True,
+        },
+        timeout=60,
+        stream=True,
+    ) as r:
+        r.raise_for_status()
+        r.raw.decode_content = True
+        page = dict(ijson.kvitems(r.raw, "", use_float=True))
+    logger.debug(
+        "Fetched %d/%d publications for author %s",
+        len(page["publications"]),
+        page["total"],
+        author_id,
     )
-    r.raise_for_status()
-    pubs = r.json().get("publications", [])
-    print(f"[fetch_all_author_publications] {author_id}: {len(pubs)} pubs")
-    return pubs
+    return page
 
 
 def extract_coauthors_from_publications(
@@ -85,13 +186,11 @@ def extract_coauthors_from_publications(
     top_n: int = 50,
 ) -> Dict[str, Any]:
 
-    from collections import Counter
-
-    counter: Counter[str] = Counter()
-    for pub in publications:
-        for aid in pub.get("authors", []):
-            if aid != author_id:
-                counter[aid] += 1
+    counter: Counter[str] = Counter(
+        aid
+        for aid in chain.from_iterable(pub.get("authors", ()) for pub in publications)
+        if aid != author_id
+    )
 
     coauthors: List[Dict[str, Any]] = []
     for aid, cnt in counter.most_common(top_n):
@@ -105,45 +204,81 @@ def extract_coauthors_from_publications(
             }
         )
 
-    if coauthors:
+    details: Dict[str, Dict[str, Any]] = {}
+    for c in coauthors:
+        cached = _cached_author(c["id"])
+        if cached:
+            details[c["id"]] = cached
+    ids_to_fetch = [c["id"] for c in coauthors if c["id"] not in details]
+
+    if ids_to_fetch:
         try:
-            r = requests.post(
+            r = _session.post(
                 f"{API_URL}/api/authors_bulk",
-                json={"ids": [c["id"] for c in coauthors]},
+                json={"ids": ids_to_fetch},
                 timeout=30,
             )
             if r.status_code == 200:
-                details = {a["id"]: a for a in r.json().get("authors", [])}
-                for c in coauthors:
-                    d = details.get(c["id"], {})
-                    c.update(
-                        {
-                            "full_name": d.get("full_name", c["full_name"]),
-                            "unit": d.get("unit", c["unit"]),
-                            "subunit": d.get("subunit", c["subunit"]),
-                        }
-                    )
+                for ad in r.json().get("authors", []):
+                    ad.setdefault("full_name", f"ID: {ad['id']}")
+                    _cache_author(ad)
+                    details[ad["id"]] = ad
         except Exception:
             pass
 
+    for c in coauthors:
+        d = details.get(c["id"], {})
+        c.update(
+            {
+                "full_name": d.get("full_name", c["full_name"]),
+                "unit": d.get("unit", c["unit"]),
+                "subunit": d.get("subunit", c["subunit"]),
+            }
+        )
+
     return {"author_id": author_id, "total": len(coauthors), "coauthors": coauthors}
 
 
 def load_author_data(author_id: str) -> Dict[str, Any]:
 
+    cache_key = f"author_data:{author_id}"
+    cached = _author_data_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     t0 = time.time()
 
-    prof_r = requests.get(f"{API_URL}/api/authors/{author_id}", timeout=30)
-    if prof_r.status_code != 200:
-        return {"error": f"Author {author_id} not found"}
-    author = prof_r.json()
+    author = _cached_author(author_id)
+    prof_f = (
+        None
+        if author
+        else _executor.submit(
+            _session.get, f"{API_URL}/api/authors/{author_id}", timeout=30
+        )
+    )
+    pubs_f = _executor.submit(fetch_author_publications_page, author_id)
+    co_f = _executor.submit(
+        _session.post,
+        f"{API_URL}/api/author_coauthors",
+        json={"author_id": author_id},
+        timeout=60,
+    )
+
+    try:
+        if prof_f is not None:
+            prof_r = prof_f.result()
+            if prof_r.status_code != 200:
+                return {"error": f"Author {author_id} not found"}
+            author = prof_r.json()
 
-    pubs = fetch_all_author_publications(author_id)
+        page = pubs_f.result()
+    except Exception as exc:
+        logger.exception("Loading author %s failed", author_id)
+        return {"error": f"Error fetching author data: {exc}"}
+    pubs = page["publications"]
 
     try:
-        co_r = requests.post(
-            f"{API_URL}/api/author_coauthors", json={"author_id": author_id}, timeout=60
-        )
+        co_r = co_f.result()
         if co_r.status_code == 200:
             coauthors = co_r.json()
         else:
@@ -151,13 +286,23 @@ def load_author_data(author_id: str) -> Dict[str, Any]:
     except Exception:
         coauthors = extract_coauthors_from_publications(pubs, author_id)
 
-    print(f"[load_author_data] {author_id}: ready in {time.time() - t0:.1f}s")
-    return {
+    logger.debug("Loaded author %s in %.1fs", author_id, time.time() - t0)
+    author_data = {
         "author": author,
         "publications": {
             "author_id": author_id,
-            "total": len(pubs),
+            "total": page["total"],
             "publications": pubs,
+            "next_cursor": page["next_cursor"],
         },
         "coauthors": coauthors,
     }
+    _author_data_cache.set(cache_key, author_data)
+
+    prefetch_ids = [
+        c["id"] for c in coauthors.get("coauthors", [])[:COAUTHOR_PREFETCH_COUNT]
+    ]
+    if prefetch_ids:
+        _executor.submit(resolve_author_names, prefetch_ids)
+
+    return author_data
@@ -1,149 +1,229 @@
 import dash_bootstrap_components as dbc
 from dash import html, dcc
-import plotly.express as px
+import plotly.graph_objects as go
+from plotly.colors import qualitative
 
 import numpy as np
-import pandas as pd
+import orjson
+import hashlib
+import threading
+from functools import lru_cache
+from itertools import islice
+from cachetools import LRUCache
 
 
 from components.visualizations_metrics import create_quality_metrics_visualization
 
 
-def create_scatter_visualization(clustering_results):
-    clusters_data = clustering_results.get("clustering_results", {})
-    clusters = clusters_data.get("clusters", [])
-    quality = clusters_data.get("quality", {})
+_EMPTY_TUPLE = ()
 
-    viz_method = quality.get("visualization_method", "")
-    if viz_method == "auto":
-        n_samples = clusters_data.get("num_publications", 0)
-        if n_samples < 50:
-            viz_method = "PCA"
-        elif n_samples < 5000:
-            viz_method = "UMAP"
-        else:
-            viz_method = "PCA"
+PUBLICATION_FIELD_DEFAULTS = {
+    "title": "",
+    "publication_year": "",
+    "publication_type": "",
+    "authors": _EMPTY_TUPLE,
+}
 
-    if not clusters:
-        return html.Div(
-            dbc.Alert(
-                [
-                    html.I(className="bi bi-exclamation-triangle me-2"),
-                    "No clusters available for visualization",
-                ],
-                color="warning",
-                className="text-center",
-            ),
-            className="p-5",
-        )
+EMPTY_PUBLICATION_FIELDS = tuple(PUBLICATION_FIELD_DEFAULTS.values())
 
-    publications_map = {}
 
-    search_results = clustering_results.get("search_results", {})
-    if search_results and "hits" in search_results:
-        for hit in search_results.get("hits", []):
-            if "id" in hit:
-                publications_map[hit["id"]] = hit
+def get_publication_fields(hit):
+    return tuple(
+        hit.get(field, default) for field, default in PUBLICATION_FIELD_DEFAULTS.items()
+    )
 
-    all_points = []
 
-    for cluster in clusters:
-        cluster_id = cluster.get("id", 0)
-        points = cluster.get("points", [])
-        publications = cluster.get("publications", [])
+SCATTER_MIN_CLUSTER_POINTS = 50
+SCATTER_CACHE_SIZE = 8
+SCATTER_TITLE_MAXLEN = 80
 
-        cluster_keywords = []
-        if "keywords" in cluster:
-            cluster_keywords = [kw for kw, _ in cluster.get("keywords", [])[:3]]
+SCATTER_SMALL_POINTS = 50
+SCATTER_MAX_POINTS = 5000
 
-        if not points:
+SCATTER_RENDER_CONFIGS = {
+    "small": {"trace": go.Scatter, "marker_size": 12, "max_points": None},
+    "UMAP": {"trace": go.Scattergl, "marker_size": 8, "max_points": SCATTER_MAX_POINTS},
+    "PCA": {"trace": go.Scattergl, "marker_size": 6, "max_points": SCATTER_MAX_POINTS},
+}
+
+_scatter_cache = LRUCache(maxsize=SCATTER_CACHE_SIZE)
+_scatter_cache_lock = threading.Lock()
+
+
+def _hover_field(label, values):
+    return np.where(values != "", label + values + "<br>", "")
+
+
+def _clip_titles(titles):
+    titles = titles.astype(str)
+    clipped = np.char.add(titles.astype(f"U{SCATTER_TITLE_MAXLEN - 3}"), "...")
+    return np.where(
+        np.char.str_len(titles) > SCATTER_TITLE_MAXLEN, clipped, titles
+    ).astype(object)
+
+
+def scatter_render_config(viz_method, n_points):
+    if n_points < SCATTER_SMALL_POINTS:
+        return SCATTER_RENDER_CONFIGS["small"]
+    if viz_method.upper() == "UMAP":
+        return SCATTER_RENDER_CONFIGS["UMAP"]
+    return SCATTER_RENDER_CONFIGS["PCA"]
+
+
+def _sample_points(codes, budget):
+    rng = np.random.default_rng(0)
+    total = len(codes)
+    keep = []
+    for code in np.unique(codes):
+        idx = np.flatnonzero(codes == code)
+        size = min(len(idx), max(SCATTER_MIN_CLUSTER_POINTS, budget * len(idx) // total))
+        keep.append(idx if size == len(idx) else rng.choice(idx, size, replace=False))
+    return np.sort(np.concatenate(keep))
+
+
+def _cluster_points(points, publications):
+    try:
+        pts = np.asarray(points, dtype=np.float32)
+    except (TypeError, ValueError):
+        pts = None
+    if pts is not None and pts.ndim == 2 and pts.shape[1] >= 2:
+        cluster_pubs = list(publications[: len(pts)])
+        cluster_pubs += [""] * (len(pts) - len(cluster_pubs))
+        return pts, cluster_pubs
+
+    coords = []
+    cluster_pubs = []
+    for i, point in enumerate(points):
+        if not isinstance(point, (list, tuple)) or len(point) < 2:
+            continue
+        try:
+            coords.append((float(point[0]), float(point[1])))
+        except (TypeError, ValueError):
             continue
+        cluster_pubs.append(publications[i] if i < len(publications) else "")
+    return np.asarray(coords, dtype=np.float32).reshape(-1, 2), cluster_pubs
 
-        for i, point in enumerate(points):
-            if isinstance(point, list) and len(point) >= 2:
-                pub_id = publications[i] if i < len(publications) else ""
-
-                pub_title = ""
-                pub_year = ""
-                pub_type = ""
-                pub_authors = []
-
-                if pub_id in publications_map:
-                    pub_data = publications_map[pub_id]
-                    pub_title = pub_data.get("title", "")
-                    pub_year = pub_data.get("publication_year", "")
-                    pub_type = pub_data.get("publication_type", "")
-                    pub_authors = pub_data.get("authors", [])
-
-                    if len(pub_title) > 80:
-                        pub_title = pub_title[:77] + "..."
-
-                hover_text = f"Title: {pub_title}<br>"
-                if pub_year:
-                    hover_text += f"Year: {pub_year}<br>"
-                if pub_type:
-                    hover_text += f"Type: {pub_type}<br>"
-                if pub_authors:
-                    authors_text = ", ".join(pub_authors[:3])
-                    if len(pub_authors) > 3:
-                        authors_text += f" and {len(pub_authors) - 3} more"
-                    hover_text += f"Authors: {authors_text}<br>"
-                if cluster_keywords:
-                    hover_text += f"Cluster keywords: {', '.join(cluster_keywords)}<br>"
-                hover_text += f"Publication ID: {pub_id}"
-
-                point_data = {
-                    "x": point[0],
-                    "y": point[1],
-                    "cluster": f"Cluster {cluster_id + 1}",
-                    "raw_cluster": cluster_id,
-                    "publication_id": pub_id,
-                    "hover_text": hover_text,
-                    "title": pub_title,
-                }
-                all_points.append(point_data)
-
-    if not all_points:
-        return html.Div(
-            dbc.Alert(
-                [
-                    html.I(className="bi bi-exclamation-triangle me-2"),
-                    "No points data available for visualization. Try different clustering method.",
-                ],
-                color="warning",
-                className="text-center",
-            ),
-            className="p-5",
-        )
 
-    df = pd.DataFrame(all_points)
-
-    fig = px.scatter(
-        df,
-        x="x",
-        y="y",
-        color="cluster",
-        hover_name="title",
-        hover_data={
-            "x": False,
-            "y": False,
-            "cluster": True,
-            "raw_cluster": False,
-            "publication_id": False,
-            "hover_text": True,
-            "title": False,
-        },
-        custom_data=["publication_id"],
-        title="Articles Clustered by Semantic Similarity",
-        labels={"x": "", "y": "", "cluster": "Cluster", "hover_text": ""},
-        color_discrete_sequence=px.colors.qualitative.Bold,
+def build_scatter_figure(clusters, search_results, viz_method):
+    publications_map = {
+        hit["id"]: get_publication_fields(hit)
+        for hit in search_results.get("hits", ())
+        if "id" in hit
+    }
+
+    total_points = sum(
+        len(cluster.get("points", _EMPTY_TUPLE)) for cluster in clusters
     )
+    xs = np.empty(total_points, dtype=np.float32)
+    ys = np.empty(total_points, dtype=np.float32)
+    categories = [f"Cluster {cluster.get('id', 0) + 1}" for cluster in clusters]
+    codes = np.empty(total_points, dtype=np.int16)
+    pub_ids = np.empty(total_points, dtype=object)
+    titles = np.empty(total_points, dtype=object)
+    years = np.empty(total_points, dtype=object)
+    types = np.empty(total_points, dtype=object)
+    authors = np.empty(total_points, dtype=object)
+    keyword_texts = [""] * len(clusters)
+    pub_fields = {}
+    k = 0
+
+    for cluster_idx, cluster in enumerate(clusters):
+        points = cluster.get("points", _EMPTY_TUPLE)
+        publications = cluster.get("publications", _EMPTY_TUPLE)
+
+        keyword_texts[cluster_idx] = ", ".join(
+            islice((kw for kw, _ in cluster.get("keywords") or _EMPTY_TUPLE), 3)
+        )
 
-    fig.update_traces(
-        marker=dict(size=10, opacity=0.7, line=dict(width=1, color="DarkSlateGrey")),
-        selector=dict(mode="markers"),
-        hovertemplate="%{customdata[0]}<br>%{hovertext}<extra></extra>",
+        if not points:
+            continue
+
+        pts, cluster_pubs = _cluster_points(points, publications)
+        n = len(pts)
+        if not n:
+            continue
+
+        xs[k : k + n] = pts[:, 0]
+        ys[k : k + n] = pts[:, 1]
+        codes[k : k + n] = cluster_idx
+        pub_ids[k : k + n] = cluster_pubs
+
+        for pos, pub_id in enumerate(cluster_pubs, k):
+            fields = pub_fields.get(pub_id)
+            if fields is None:
+                pub_title, pub_year, pub_type, pub_authors = publications_map.get(
+                    pub_id, EMPTY_PUBLICATION_FIELDS
+                )
+
+                authors_text = ", ".join(pub_authors[:3])
+                if len(pub_authors) > 3:
+                    authors_text += f" and {len(pub_authors) - 3} more"
+
+                fields = pub_fields[pub_id] = (
+                    pub_title,
+                    str(pub_year) if pub_year else "",
+                    str(pub_type) if pub_type else "",
+                    authors_text,
+                )
+
+            titles[pos], years[pos], types[pos], authors[pos] = fields
+
+        k += n
+
+    if not k:
+        return None, 0, 0
+
+    columns = [
+        xs[:k],
+        ys[:k],
+        codes[:k],
+        pub_ids[:k],
+        titles[:k],
+        years[:k],
+        types[:k],
+        authors[:k],
+    ]
+    cfg = scatter_render_config(viz_method, k)
+    if cfg["max_points"] and k > cfg["max_points"]:
+        keep = _sample_points(codes[:k], cfg["max_points"])
+        columns = [col[keep] for col in columns]
+    xs, ys, codes, pub_ids, titles, years, types, authors = columns
+    titles = _clip_titles(titles)
+
+    details = (
+        _hover_field("Year: ", years)
+        + _hover_field("Type: ", types)
+        + _hover_field("Authors: ", authors)
     )
+    customdata = np.column_stack((pub_ids, titles, details))
+
+    trace_type = cfg["trace"]
+    palette = qualitative.Bold
+
+    fig = go.Figure()
+    for idx, code in enumerate(np.unique(codes)):
+        sel = np.flatnonzero(codes == code)
+        keywords = keyword_texts[code]
+        fig.add_trace(
+            trace_type(
+                x=xs[sel],
+                y=ys[sel],
+                mode="markers",
+                name=categories[code],
+                customdata=customdata[sel],
+                hovertemplate=(
+                    "Title: %{customdata[1]}<br>%{customdata[2]}"
+                    + (f"Cluster keywords: {keywords}<br>" if keywords else "")
+                    + "Publication ID: %{customdata[0]}<extra></extra>"
+                ),
+                marker=dict(
+                    size=cfg["marker_size"],
+                    opacity=0.7,
+                    line=dict(width=1, color="DarkSlateGrey"),
+                    color=palette[idx % len(palette)],
+                ),
+            )
+        )
 
     fig.update_layout(
         xaxis=dict(
@@ -160,6 +240,7 @@ def create_scatter_visualization(clustering_results):
             gridcolor="rgba(0,0,0,0.1)",
             zeroline=False,
         ),
+        title="Articles Clustered by Semantic Similarity",
         hovermode="closest",
         legend_title="Clusters",
         height=650,  
@@ -178,6 +259,69 @@ def create_scatter_visualization(clustering_results):
         plot_bgcolor="white",
     )
 
+    return fig.to_dict(), len(xs), k
+
+
+def create_scatter_visualization(clustering_results):
+    clusters_data = clustering_results.get("clustering_results", {})
+    clusters = clusters_data.get("clusters", _EMPTY_TUPLE)
+    quality = clusters_data.get("quality", {})
+
+    viz_method = quality.get("visualization_method", "")
+    if viz_method == "auto":
+        n_samples = clusters_data.get("num_publications", 0)
+        if n_samples < 50:
+            viz_method = "PCA"
+        elif n_samples < 5000:
+            viz_method = "UMAP"
+        else:
+            viz_method = "PCA"
+
+    if not clusters:
+        return html.Div(
+            dbc.Alert(
+                [
+                    html.I(className="bi bi-exclamation-triangle me-2"),
+                    "No clusters available for visualization",
+                ],
+                color="warning",
+                className="text-center",
+            ),
+            className="p-5",
+        )
+
+    search_results = clustering_results.get("search_results") or {}
+    fingerprint = hashlib.blake2b(
+        orjson.dumps(
+            [
+                viz_method,
+                clusters,
+                [hit.get("id") for hit in search_results.get("hits", ())],
+            ]
+        ),
+        digest_size=16,
+    ).hexdigest()
+    with _scatter_cache_lock:
+        cached = _scatter_cache.get(fingerprint)
+    if cached is None:
+        cached = build_scatter_figure(clusters, search_results, viz_method)
+        with _scatter_cache_lock:
+            _scatter_cache[fingerprint] = cached
+    fig, shown, total = cached
+
+    if fig is None:
+        return html.Div(
+            dbc.Alert(
+                [
+                    html.I(className="bi bi-exclamation-triangle me-2"),
+                    "No points data available for visualization. Try different clustering method.",
+                ],
+                color="warning",
+                className="text-center",
+            ),
+            className="p-5",
+        )
+
     return html.Div(
         [
             html.P(
@@ -187,6 +331,10 @@ def create_scatter_visualization(clustering_results):
                         f" Visualization method: {viz_method}" if viz_method else "",
                         className="badge bg-secondary ms-2"
                     ) if viz_method else None,
+                    html.Span(
+                        f"Showing {shown} of {total} points",
+                        className="badge bg-info ms-2",
+                    ) if shown < total else None,
                 ],
                 className="text-muted mb-2",
             ),
@@ -238,28 +386,17 @@ def create_visualization_tabs(clustering_results):
     return html.Div([html.H4("Cluster Visualizations", className="mb-3"), tabs])
 
 
-def create_cluster_dropdown(clusters):
-    if not clusters:
-        return dbc.Select(
-            id="cluster-select",
-            options=[{"label": "No clusters available", "value": "none"}],
-            value="none",
-            disabled=True,
-        )
-
+@lru_cache(maxsize=16)
+def cluster_dropdown_options(fingerprint):
     options = []
-    for cluster in clusters:
-        cluster_id = cluster.get("id", 0)
+    for cluster_id, size, top_keywords in fingerprint:
         display_cluster_id = (
             cluster_id + 1 if isinstance(cluster_id, int) else cluster_id
         )
 
-        size = cluster.get("size", 0)
         keywords_text = ""
-        if cluster.get("keywords"):
-            top_keywords = [kw for kw, _ in cluster.get("keywords", [])[:3]]
-            if top_keywords:
-                keywords_text = f" - Keywords: {', '.join(top_keywords)}"
+        if top_keywords:
+            keywords_text = f" - Keywords: {', '.join(top_keywords)}"
 
         options.append(
             {
@@ -267,6 +404,30 @@ def create_cluster_dropdown(clusters):
                 "value": str(cluster_id),
             }
         )
+    return options
+
+
+def create_cluster_dropdown(clusters):
+    if not clusters:
+        return dbc.Select(
+            id="cluster-select",
+            options=[{"label": "No clusters available", "value": "none"}],
+            value="none",
+            disabled=True,
+        )
+
+    options = cluster_dropdown_options(
+        tuple(
+            (
+                cluster.get("id", 0),
+                cluster.get("size", 0),
+                tuple(
+                    islice((kw for kw, _ in cluster.get("keywords") or _EMPTY_TUPLE), 3)
+                ),
+            )
+            for cluster in clusters
+        )
+    )
 
     return dbc.Select(
         id="cluster-select",
@@ -276,6 +437,83 @@ def create_cluster_dropdown(clusters):
     )
 
 
+def normalize_silhouette(silhouette):
+    if silhouette is None or np.isnan(silhouette):
+        return None
+    return round(float(silhouette), 3)
+
+
+@lru_cache(maxsize=32)
+def build_stats_card(method, n_clusters, silhouette, share_noise, is_adaptive):
+    silhouette_color = "success"
+    if silhouette is not None:
+        if silhouette < 0.3:
+            silhouette_color = "danger"
+        elif silhouette < 0.5:
+            silhouette_color = "warning"
+
+    return dbc.Card(
+        [
+            dbc.CardHeader(
+                [
+                    html.I(className="bi bi-bar-chart-fill me-2"),
+                    "Clustering Statistics",
+                ]
+            ),
+            dbc.CardBody(
+                [
+                    html.P(
+                        [
+                            html.Strong("Method: "),
+                            html.Span(method),
+                        ],
+                        className="mb-2",
+                    ),
+                    html.P(
+                        [
+                            html.Strong("Number of Clusters: "),
+                            html.Span(str(n_clusters)),
+                        ],
+                        className="mb-2",
+                    ),
+                    html.P(
+                        [
+                            html.Strong("Silhouette Score: "),
+                            dbc.Badge(
+                                (
+                                    f"{silhouette:.3f}"
+                                    if silhouette is not None
+                                    else "N/A"
+                                ),
+                                color=silhouette_color,
+                            ),
+                        ],
+                        className="mb-2",
+                    ),
+                    html.P(
+                        [
+                            html.Strong("Noise Points: "),
+                            html.Span(f"{share_noise:.1%}"),
+                        ],
+                        className="mb-0",
+                    ),
+
+                    html.Div(
+                        dbc.Badge(
+                            "Adaptive parameter optimization",
+                            color="primary",
+                            className="mt-2",
+                        ),
+                        className="text-center",
+                        style={"display": "block" if is_adaptive else "none"}
+                    ),
+                ]
+            ),
+        ],
+        className="mb-3 shadow-sm",
+    )
+
+
 def create_enhanced_visualization_panel(clustering_results=None):
     if not clustering_results:
         return html.Div(
@@ -316,7 +554,7 @@ def create_enhanced_visualization_panel(clustering_results=None):
         )
 
     clusters_data = clustering_results.get("clustering_results", {})
-    clusters = clusters_data.get("clusters", [])
+    clusters = clusters_data.get("clusters", _EMPTY_TUPLE)
     method = clusters_data.get("method", "")
     n_clusters = clusters_data.get("n_clusters", 0)
     quality = clusters_data.get("quality", {})
@@ -350,85 +588,21 @@ def create_enhanced_visualization_panel(clustering_results=None):
             )
         )
 
-    silhouette = quality.get("silhouette", float("nan"))
-    silhouette_color = "success"
-    if silhouette < 0.3:
-        silhouette_color = "danger"
-    elif silhouette < 0.5:
-        silhouette_color = "warning"
-
     quality_metrics_panel = create_quality_metrics_visualization(clustering_results)
 
-    is_adaptive = "adaptive" in method.lower() or "parameter_metrics" in quality
-
-
     return html.Div(
         [
             dbc.Row(
                 [
                     dbc.Col(
                         [
-                            dbc.Card(
-                                [
-                                    dbc.CardHeader(
-                                        [
-                                            html.I(className="bi bi-bar-chart-fill me-2"),
-                                            "Clustering Statistics",
-                                        ]
-                                    ),
-                                    dbc.CardBody(
-                                        [
-                                            html.P(
-                                                [
-                                                    html.Strong("Method: "),
-                                                    html.Span(method),
-                                                ],
-                                                className="mb-2",
-                                            ),
-                                            html.P(
-                                                [
-                                                    html.Strong("Number of Clusters: "),
-                                                    html.Span(str(n_clusters)),
-                                                ],
-                                                className="mb-2",
-                                            ),
-                                            html.P(
-                                                [
-                                                    html.Strong("Silhouette Score: "),
-                                                    dbc.Badge(
-                                                        (
-                                                            f"{silhouette:.3f}"
-                                                            if not np.isnan(silhouette)
-                                                            else "N/A"
-                                                        ),
-                                                        color=silhouette_color,
-                                                    ),
-                                                ],
-                                                className="mb-2",
-                                            ),
-                                            html.P(
-                                                [
-                                                    html.Strong("Noise Points: "),
-                                                    html.Span(
-                                                        f"{quality.get('share_noise', 0):.1%}"
-                                                    ),
-                                                ],
-                                                className="mb-0",
-                                            ),
-
-                                            html.Div(
-                                                dbc.Badge(
-                                                    "Adaptive parameter optimization",
-                                                    color="primary",
-                                                    className="mt-2",
-                                                ),
-                                                className="text-center",
-                                                style={"display": "block" if is_adaptive else "none"}
-                                            ),
-                                        ]
-                                    ),
-                                ],
-                                className="mb-3 shadow-sm",
+                            build_stats_card(
+                                method,
+                                n_clusters,
+                                normalize_silhouette(quality.get("silhouette")),
+                                quality.get("share_noise", 0),
+                                "adaptive" in method.lower()
+                                or "parameter_metrics" in quality,
                             ),
                             create_points_info_panel(),
 
@@ -488,48 +662,51 @@ def create_enhanced_visualization_panel(clustering_results=None):
         ]
     )
 
+points_info_panel = dbc.Card(
+    [
+        dbc.CardHeader(
+            [html.I(className="bi bi-info-circle me-2"), "About Point Positioning"]
+        ),
+        dbc.CardBody(
+            [
+                html.P(
+                    "Points represent semantic embeddings of articles reduced to 2D space. "
+                    "Articles with similar content are positioned closer together."
+                ),
+                dbc.Button(
+                    ["Learn more ", html.I(className="bi bi-caret-down-fill")],
+                    id="points-info-button",
+                    color="link",
+                    className="p-0 mb-2",
+                ),
+                dbc.Collapse(
+                    [
+                        html.P(
+                            [
+                                html.Strong("X, Y coordinates: "),
+                                "Generated by dimensionality reduction algorithms (UMAP or PCA) "
+                                "from high-dimensional semantic embeddings.",
+                            ],
+                            className="mb-1",
+                        ),
+                        html.P(
+                            [
+                                html.Strong("Dimension reduction: "),
+                                "The system automatically selects the best reduction method between PCA, UMAP"
+                                "based on dataset characteristics when using adaptive mode.",
+                            ],
+                            className="mb-0 text-muted small",
+                        ),
+                    ],
+                    id="points-info-collapse",
+                    is_open=False,
+                ),
+            ]
+        ),
+    ],
+    className="shadow-sm mb-3",
+)
+
+
 def create_points_info_panel():
-    return dbc.Card(
-        [
-            dbc.CardHeader(
-                [html.I(className="bi bi-info-circle me-2"), "About Point Positioning"]
-            ),
-            dbc.CardBody(
-                [
-                    html.P(
-                        "Points represent semantic embeddings of articles reduced to 2D space. "
-                        "Articles with similar content are positioned closer together."
-                    ),
-                    dbc.Button(
-                        ["Learn more ", html.I(className="bi bi-caret-down-fill")],
-                        id="points-info-button",
-                        color="link",
-                        className="p-0 mb-2",
-                    ),
-                    dbc.Collapse(
-                        [
-                            html.P(
-                                [
-                                    html.Strong("X, Y coordinates: "),
-                                    "Generated by dimensionality reduction algorithms (UMAP or PCA) "
-                                    "from high-dimensional semantic embeddings.",
-                                ],
-                                className="mb-1",
-                            ),
-                            html.P(
-                                [
-                                    html.Strong("Dimension reduction: "),
-                                    "The system automatically selects the best reduction method between PCA, UMAP"
-                                    "based on dataset characteristics when using adaptive mode.",
-                                ],
-                                className="mb-0 text-muted small",
-                            ),
-                        ],
-                        id="points-info-collapse",
-                        is_open=False,
-                    ),
-                ]
-            ),
-        ],
-        className="shadow-sm mb-3",
-    )
\ No newline at end of file
+    return points_info_panel
@@ -1,24 +1,41 @@
 from typing import Dict, Any, List
 import os
 import requests
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import dash_bootstrap_components as dbc
 from dash import html
 
 API_URL: str = os.environ.get("API_URL", "http://localhost:8000")
 TIMEOUT: int = int(os.environ.get("PAGINATION_TIMEOUT", 60))
 
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+    ),
+)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
 
 def fetch_all_unit_publications(unit_name: str, *, lite: bool = True) -> Dict[str, Any]:
 
     try:
 
-        resp = requests.post(
+        resp = _session.post(
             f"{API_URL}/api/unit_publications",
             json={"unit": unit_name, "size": 0, "cluster_results": False, "lite": lite},
             timeout=TIMEOUT,
         )
         if resp.status_code == 200:
-            return resp.json()
+            return orjson.loads(resp.content)
 
         return {"error": f"HTTP {resp.status_code}: {resp.text}"}
 
@@ -40,14 +57,12 @@ def extract_collaborations_from_publications(
     if not unit_name or not publications:
         return []
 
-    denormalized = len(publications) > 0 and "author_units" in publications[0]
-    counter = Counter()
+    if "author_units" not in publications[0]:
+        return []
 
+    counter = Counter()
     for pub in publications:
-        if denormalized:
-            for other in pub.get("author_units", []):
-                if other != unit_name:
-                    counter[other] += 1
+        counter.update(u for u in pub.get("author_units", ()) if u != unit_name)
 
     return [
         {"unit": other, "joint_publications": cnt}
@@ -58,28 +73,7 @@ def extract_collaborations_from_publications(
 def create_pagination(current_page, total_pages, id_prefix="pagination"):
 
     if total_pages <= 1:
-        return html.Div()  
-    
-
-    pages_to_show = set()
-
-    pages_to_show.add(1)
-    pages_to_show.add(total_pages)
-    
-
-    for i in range(max(1, current_page - 1), min(total_pages + 1, current_page + 2)):
-        pages_to_show.add(i)
-    
-
-    if current_page > 3:
-        pages_to_show.add(2)
-    if current_page < total_pages - 2:
-        pages_to_show.add(total_pages - 1)
-    
-
-    pages_list = sorted(list(pages_to_show))
-    
-
+        return html.Div()
 
     return html.Div(
         [
@@ -1,7 +1,160 @@
 import dash_bootstrap_components as dbc
-from dash import html, dcc
-import plotly.express as px
-from components.author_link_component import create_article_author_links
+from dash import html, dcc, Input, Output, State, ALL, no_update, ClientsideFunction
+from dash.exceptions import PreventUpdate
+import plotly.graph_objects as go
+from plotly.colors import qualitative
+import heapq
+from functools import lru_cache
+from operator import itemgetter
+from components.author_link_component import resolve_author_names
+
+PAGE_SIZE = 10
+
+FACET_TITLES = (
+    ("years", "Timeline"),
+    ("keywords", "Top Keywords"),
+    ("types", "Publication Types"),
+)
+
+FACET_MARGIN = dict(l=10, r=10, t=40, b=20)
+FACET_GRAPH_CONFIG = {"displayModeBar": False}
+FACET_TYPE_COLORS = qualitative.Bold
+
+_get_year = itemgetter("year")
+_get_count = itemgetter("count")
+
+
+@lru_cache(maxsize=256)
+def build_year_figure(years):
+    labels, counts = zip(*years)
+    fig = go.Figure(
+        go.Bar(
+            x=labels,
+            y=counts,
+            marker=dict(color=counts, colorscale="Viridis", showscale=False),
+        )
+    )
+    fig.update_layout(
+        title="Publications by Year",
+        xaxis_title="Year",
+        yaxis_title="Count",
+        margin=FACET_MARGIN,
+        height=250,
+        xaxis=dict(tickangle=45),
+    )
+    return fig
+
+
+@lru_cache(maxsize=256)
+def build_keywords_figure(kws):
+    labels, counts = zip(*kws)
+    fig = go.Figure(
+        go.Bar(
+            x=counts,
+            y=labels,
+            orientation="h",
+            marker=dict(color=counts, colorscale="Viridis", showscale=False),
+        )
+    )
+    fig.update_layout(
+        title="Top Keywords",
+        xaxis_title="Count",
+        yaxis_title="Keyword",
+        margin=FACET_MARGIN,
+        height=250,
+    )
+    return fig
+
+
+@lru_cache(maxsize=256)
+def build_types_figure(types):
+    labels, counts = zip(*types)
+    fig = go.Figure(
+        go.Pie(
+            labels=labels,
+            values=counts,
+            hole=0.4,
+            marker=dict(colors=FACET_TYPE_COLORS),
+        )
+    )
+    fig.update_layout(
+        title="Publication Types",
+        margin=FACET_MARGIN,
+        height=250,
+        legend=dict(orientation="h", y=-0.15)
+    )
+    return fig
+
+
+def serialize_result_cards(hits):
+    hit_authors = [
+        [authors] if isinstance(authors, str) else authors
+        for authors in (hit.get("authors") or [] for hit in hits)
+    ]
+    all_author_ids = list(
+        dict.fromkeys(aid for authors in hit_authors for aid in authors)
+    )
+    author_data = resolve_author_names(all_author_ids) if all_author_ids else {}
+
+    cards = []
+
+    for hit, authors in zip(hits, hit_authors):
+        g = hit.get
+        kws = g("keywords") or []
+        kws = [kws] if isinstance(kws, str) else list(kws)
+
+        abstract = g("abstract") or "No abstract"
+        if abstract[300:301]:
+            abstract = abstract[:300] + "..."
+
+        cards.append(
+            {
+                "id": g("id", ""),
+                "title": g("title", "No title"),
+                "year": g("publication_year", "Unknown"),
+                "type": g("publication_type", "Unknown"),
+                "score": f"{g('_score') or 0:.2f}",
+                "abstract": abstract,
+                "keywords": kws[:5],
+                "keyword_count": len(kws),
+                "authors": [
+                    {
+                        "id": aid,
+                        "name": author_data.get(aid, {}).get("full_name", f"ID: {aid}"),
+                    }
+                    for aid in authors
+                ],
+            }
+        )
+
+    return cards
+
+
+FACET_FIGURE_BUILDERS = {
+    "years": build_year_figure,
+    "keywords": build_keywords_figure,
+    "types": build_types_figure,
+}
+
+
+def create_results_page(hits, current_page, total_hits=None):
+    if total_hits is None:
+        total_hits = len(hits)
+
+    page_start = (current_page - 1) * PAGE_SIZE
+    page_end = min(page_start + PAGE_SIZE, total_hits)
+    total_pages = -(-total_hits // PAGE_SIZE)
+
+    if len(hits) > PAGE_SIZE:
+        hits = hits[page_start:page_end]
+
+    return (
+        serialize_result_cards(hits),
+        f"Showing results {page_start + 1}-{page_end} of {total_hits}",
+        f"Page {current_page} of {total_pages}",
+        None if current_page == 1 else {"display": "none"},
+    )
+
 
 def create_results_panel(hits=None, facets=None, current_page=1, total_hits=None):
     if not hits:
@@ -15,217 +168,50 @@ def create_results_panel(hits=None, facets=None, current_page=1, total_hits=None
     if total_hits is None:
         total_hits = len(hits)
 
-    facets_charts = []
-    
-    year_chart = None
-    if facets and "publication_years" in facets:
-        years = sorted(facets["publication_years"], key=lambda x: x["year"])
+    facets_panel = None
+    if facets:
+        facet_data = {}
+
+        years = sorted(facets.get("publication_years") or [], key=_get_year)
         if years:
-            fig = px.bar(
-                years,
-                x="year",
-                y="count",
-                title="Publications by Year",
-                labels={"year": "Year", "count": "Count"},
-                color="count",
-                color_continuous_scale="Viridis",
-            )
-            fig.update_layout(
-                coloraxis_showscale=False,
-                margin=dict(l=10, r=10, t=40, b=20),
-                height=250,
-                xaxis=dict(tickangle=45),
-            )
-            year_chart = dbc.Card([
-                dbc.CardHeader([
-                    html.I(className="bi bi-calendar me-2"),
-                    "Timeline"
-                ]),
-                dbc.CardBody(
-                    dcc.Graph(
-                        figure=fig, 
-                        config={"displayModeBar": False}
-                    ),
-                    className="p-2"
-                )
-            ])
-            facets_charts.append(dbc.Col(year_chart, width=12, lg=6, className="mb-3"))
-
-    keywords_chart = None
-    if facets and "keywords" in facets:
-        kws = sorted(facets["keywords"], key=lambda x: x["count"], reverse=True)[:10]
+            facet_data["years"] = [(y["year"], y["count"]) for y in years]
+
+        kws = heapq.nlargest(10, facets.get("keywords") or [], key=_get_count)
         if kws:
-            fig = px.bar(
-                kws,
-                x="count",
-                y="value",
-                orientation="h",
-                title="Top Keywords",
-                labels={"count": "Count", "value": "Keyword"},
-                color="count",
-                color_continuous_scale="Viridis",
-            )
-            fig.update_layout(
-                coloraxis_showscale=False,
-                margin=dict(l=10, r=10, t=40, b=20),
-                height=250,
-            )
-            keywords_chart = dbc.Card([
-                dbc.CardHeader([
-                    html.I(className="bi bi-tags me-2"),
-                    "Top Keywords"
-                ]),
-                dbc.CardBody(
-                    dcc.Graph(
-                        figure=fig, 
-                        config={"displayModeBar": False}
-                    ),
-                    className="p-2"
-                )
-            ])
-            facets_charts.append(dbc.Col(keywords_chart, width=12, lg=6, className="mb-3"))
-    
-    pub_types_chart = None
-    if facets and "publication_types" in facets:
-        types = sorted(facets["publication_types"], key=lambda x: x["count"], reverse=True)
+            facet_data["keywords"] = [(k["value"], k["count"]) for k in kws]
+
+        types = sorted(facets.get("publication_types") or [], key=_get_count, reverse=True)
         if types:
-            fig = px.pie(
-                types,
-                values="count",
-                names="value",
-                title="Publication Types",
-                hole=0.4,
-                color_discrete_sequence=px.colors.qualitative.Bold,
-            )
-            fig.update_layout(
-                margin=dict(l=10, r=10, t=40, b=20),
-                height=250,
-                legend=dict(orientation="h", y=-0.15)
-            )
-            pub_types_chart = dbc.Card([
-                dbc.CardHeader([
-                    html.I(className="bi bi-journals me-2"),
-                    "Publication Types"
-                ]),
-                dbc.CardBody(
-                    dcc.Graph(
-                        figure=fig, 
-                        config={"displayModeBar": False}
-                    ),
-                    className="p-2"
-                )
-            ])
-            facets_charts.append(dbc.Col(pub_types_chart, width=12, lg=6, className="mb-3"))
-
-    if facets_charts:
-        facets_panel = dbc.Row(
-            facets_charts,
-            className="mt-3 mb-4",
-            id="facets-panel"  
-        )
-    else:
-        facets_panel = None
-
-    results_list = []
-    for hit in hits:
-        article_id = hit.get("id", "")
-        
-        abstract = hit.get("abstract", "")
-        if len(abstract) > 300:
-            abstract = abstract[:300] + "..."
+            facet_data["types"] = [(t["value"], t["count"]) for t in types]
 
-        card = dbc.Card(
-            [
-                dbc.CardBody(
-                    [
-                        html.H5(
-                            hit.get("title", "No title"), 
-                            className="card-title"
-                        ),
-                        html.Div(
-                            [
-                                dbc.Badge(
-                                    f"Year: {hit.get('publication_year','Unknown')}",
-                                    color="primary",
-                                    className="me-2",
-                                ),
-                                dbc.Badge(
-                                    f"Type: {hit.get('publication_type','Unknown')}",
-                                    color="secondary",
-                                    className="me-2",
-                                ),
-                                dbc.Badge(
-                                    f"Score: {hit.get('_score', 0):.2f}",
-                                    color="light",
-                                    text_color="dark",
-                                    className="me-2",
+        if facet_data:
+            facets_panel = html.Div(
+                [
+                    dcc.Store(id="facets-data", data=facet_data),
+                    dbc.Accordion(
+                        [
+                            dbc.AccordionItem(
+                                dcc.Graph(
+                                    id={"type": "facet-graph", "facet": facet},
+                                    config=FACET_GRAPH_CONFIG,
                                 ),
-                            ],
-                            className="mb-2",
-                        ),
-                        html.P(
-                            abstract or "No abstract", 
-                            className="card-text"
-                        ),
-
-                        (
-                            html.P(
-                                [
-                                    html.Strong("Authors: "),
-                                    create_article_author_links(hit.get("authors", []))
-                                ],
-                                className="mb-2"
+                                title=title,
+                                item_id=facet,
                             )
-                            if hit.get("authors")
-                            else None
-                        ),
-                        (
-                            html.P(
-                                [
-                                    html.Strong("Keywords: "),
-                                    html.Span(
-                                        [item for kw_list in [
-                                            [
-                                                dbc.Badge(
-                                                    keyword,
-                                                    color="light",
-                                                    text_color="dark",
-                                                    className="me-1",
-                                                )
-                                            ] for keyword in hit.get("keywords", [])[:5]
-                                        ] for item in kw_list] + 
-                                        ([
-                                            dbc.Badge(
-                                                f"+{len(hit.get('keywords', [])) - 5} more",
-                                                color="light",
-                                                text_color="dark",
-                                                className="me-1",
-                                            )
-                                        ] if len(hit.get("keywords", [])) > 5 else [])
-                                    ),
-                                ]
-                            )
-                            if hit.get("keywords")
-                            else None
-                        ),
-
-                        html.Div(
-                            dbc.Button(
-                                "View Details",
-                                id={"type": "article-card", "id": article_id},
-                                color="primary",
-                                outline=True,
-                                size="sm",
-                                className="mt-2",
-                            ),
-                            className="text-end",
-                        ),
-                    ]
-                )
-            ],
-            className="mb-3 shadow-sm",
-        )
-        results_list.append(card)
+                            for facet, title in FACET_TITLES
+                            if facet in facet_data
+                        ],
+                        id="facets-accordion",
+                        start_collapsed=True,
+                    ),
+                ],
+                className="mt-3 mb-4",
+                id="facets-panel",
+            )
+
+    results_data, info_text, page_label, first_page_style = create_results_page(
+        hits, current_page, total_hits
+    )
 
     action_panel = dbc.Row(
         [
@@ -248,35 +234,7 @@ def create_results_panel(hits=None, facets=None, current_page=1, total_hits=None
     )
 
 
-    total_pages = (total_hits + 9) // 10
-    
-
-    pages_to_show = []
-    
-
-    if total_pages > 5:
-
-        pages_to_show.append(1) 
-        
-
-        start_range = max(2, current_page - 2)
-        end_range = min(total_pages - 1, current_page + 2)
-        
-
-        if start_range > 2:
-            pages_to_show.append('...')
-        
-
-        pages_to_show.extend(list(range(start_range, end_range + 1)))
-        
-
-        if end_range < total_pages - 1:
-            pages_to_show.append('...')
-        
-        pages_to_show.append(total_pages)  
-    else:
-
-        pages_to_show = list(range(1, total_pages + 1))
+    total_pages = -(-total_hits // PAGE_SIZE)
 
     pagination = dbc.Row(
         [
@@ -284,7 +242,7 @@ def create_results_panel(hits=None, facets=None, current_page=1, total_hits=None
                 [
                     html.Div(
                         [
-                            html.Span(f"Page {current_page} of {total_pages}", className="me-3"),
+                            html.Span(page_label, id="results-page-label", className="me-3"),
                             dbc.Pagination(
                                 id="results-pagination",
                                 max_value=total_pages,
@@ -312,46 +270,55 @@ def create_results_panel(hits=None, facets=None, current_page=1, total_hits=None
     )
 
     result_info = html.P(
-        f"Showing results {(current_page-1)*10 + 1}-{min(current_page*10, total_hits)} of {total_hits}",
+        info_text,
         className="text-muted mb-3 text-center",
         id="result-info"  
     )
 
-    pagination_css = dcc.Markdown(
-        """
-        <style>
-        .pagination-wrap {
-            flex-wrap: wrap !important;
-            justify-content: center !important;
-        }
-        .pagination-wrap .page-item {
-            margin: 2px !important;
-        }
-        
-        /* Make sure pagination items are all the same size */
-        .pagination-wrap .page-link {
-            min-width: 38px !important;
-            text-align: center !important;
-        }
-        </style>
-        """,
-        dangerously_allow_html=True,
+    children = [
+        html.H3(
+            [
+                f"Found {total_hits} articles",
+            ],
+            className="mb-3",
+        ),
+        html.Div(
+            [facets_panel, action_panel] if facets_panel else action_panel,
+            id="results-first-page",
+            style=first_page_style,
+        ),
+        result_info,
+        dcc.Store(id="results-data", data=results_data),
+        html.Div(id="results-list"),  
+    ]
+    if total_pages > 1:
+        children.append(pagination)
+
+    return html.Div(children, id="complete-results-panel")
+
+
+def register_results_callbacks(app):
+    app.clientside_callback(
+        ClientsideFunction(namespace="results", function_name="renderCards"),
+        Output("results-list", "children"),
+        Input("results-data", "data"),
+    )
+
+    @app.callback(
+        Output({"type": "facet-graph", "facet": ALL}, "figure"),
+        Input("facets-accordion", "active_item"),
+        State("facets-data", "data"),
+        State({"type": "facet-graph", "facet": ALL}, "id"),
+        prevent_initial_call=True,
     )
+    def load_facet_figure(active_item, facet_data, graph_ids):
+        if not active_item or not facet_data or active_item not in facet_data:
+            raise PreventUpdate
 
-    return html.Div(
-        [
-            pagination_css,
-            html.H3(
-                [
-                    f"Found {total_hits} articles",
-                ],
-                className="mb-3",
-            ),
-            facets_panel if facets_panel and current_page == 1 else html.Div(),
-            action_panel if current_page == 1 else html.Div(),
-            result_info,
-            html.Div(results_list, id="results-list"),  
-            pagination if total_pages > 1 else html.Div(),
-        ],
-        id="complete-results-panel" 
-    )
\ No newline at end of file
+        fig = FACET_FIGURE_BUILDERS[active_item](
+            tuple(map(tuple, facet_data[active_item]))
+        )
+        return [
+            fig if graph_id["facet"] == active_item else no_update
+            for graph_id in graph_ids
+        ]
@@ -1,57 +1,203 @@
+import sys
 import dash_bootstrap_components as dbc
-from dash import html, dcc, callback, Input, Output
+from dash import html, dcc, callback, clientside_callback, Input, Output, State, no_update
 
 
-def create_search_panel():
+PUBLICATION_TYPES = tuple(
+    sorted(
+        map(
+            sys.intern,
+            (
+                "patent",
+                "materiały konferencyjne (aut.)",
+                "artykuł w czasopiśmie",
+                "referat w czasopiśmie",
+                "abstrakt w czasopiśmie",
+                "fragment książki",
+                "monografia pokonferencyjna",
+                "redakcja czasopisma",
+                "redakcja serii",
+                "rozdział w podręczniku",
+                "książka",
+                "skrypt",
+                "monografia",
+                "zgłoszenie patentowe",
+                "podręcznik",
+                "patent zastosowany",
+                "fragment monografii pokonferencyjnej",
+                "raporty, sprawozdania, inne (fragment)",
+                "materiały konferencyjne (red.)",
+                "przegląd",
+                "raporty, sprawozdania, inne (całość)",
+                "recenzja",
+                "nota edytorska",
+                "wywiad, rozmowa",
+                "zgłoszenie wzoru użytkowego",
+                "komunikat",
+                "wzór użytkowy",
+                "wstęp",
+                "atlas, mapy",
+                "hasło w encyklopedii/słowniku",
+                "wzór przemysłowy",
+                "list",
+                "mapa",
+                "znak towarowy",
+                "norma",
+                "znak towarowy zastosowany",
+                "przekład",
+                "encyklopedia, słownik",
+                "komitet redakcyjny czasopisma",
+            ),
+        )
+    )
+)
+
+PUBLICATION_TYPES_SET = frozenset(PUBLICATION_TYPES)
+
+PUBLICATION_TYPE_OPTIONS = [{"label": "All Types", "value": "all"}] + [
+    {"label": pt, "value": pt} for pt in PUBLICATION_TYPES
+]
+
+SIZE_MARKS = {size: str(size) for size in (5, 50, 150, 250, 500, 1000, 1500)}
+YEAR_MARKS = {year: str(year) for year in (1974, *range(1980, 2026, 5))}
+SLIDER_TOOLTIP = {"placement": "bottom", "always_visible": True}
+
+SEARCH_TIPS = """**Search tips:**
+
+- **Phrase Search:** Use quotes for exact matching in text-based search. Example: `"neural networks"`
+- **Combined Search:** Mix phrases and regular terms in text-based search. Example: `"machine learning" application`
+"""
 
-    publication_types = [
-        "patent",
-        "materiały konferencyjne (aut.)",
-        "artykuł w czasopiśmie",
-        "referat w czasopiśmie",
-        "abstrakt w czasopiśmie",
-        "fragment książki",
-        "monografia pokonferencyjna",
-        "redakcja czasopisma",
-        "redakcja serii",
-        "rozdział w podręczniku",
-        "książka",
-        "skrypt",
-        "monografia",
-        "zgłoszenie patentowe",
-        "podręcznik",
-        "patent zastosowany",
-        "fragment monografii pokonferencyjnej",
-        "raporty, sprawozdania, inne (fragment)",
-        "materiały konferencyjne (red.)",
-        "przegląd",
-        "raporty, sprawozdania, inne (całość)",
-        "recenzja",
-        "nota edytorska",
-        "wywiad, rozmowa",
-        "zgłoszenie wzoru użytkowego",
-        "komunikat",
-        "wzór użytkowy",
-        "wstęp",
-        "atlas, mapy",
-        "hasło w encyklopedii/słowniku",
-        "wzór przemysłowy",
-        "list",
-        "mapa",
-        "znak towarowy",
-        "norma",
-        "znak towarowy zastosowany",
-        "przekład",
-        "encyklopedia, słownik",
-        "komitet redakcyjny czasopisma",
-    ]
+SEARCH_PARAM_DEFAULTS = {
+    "search_method": "hybrid",
+    "size": 100,
+    "year_range": [2000, 2025],
+    "pub_types": ["all"],
+}
 
-    publication_types.sort()
 
-    publication_type_options = [{"label": "All Types", "value": "all"}] + [
-        {"label": pt, "value": pt} for pt in publication_types
-    ]
+def bi_icon(name, className="me-2", **kwargs):
+    return html.I(className=f"bi bi-{name} {className}", **kwargs)
 
+
+def create_search_params_body():
+    return dbc.Card(
+        [
+            dbc.CardHeader(
+                html.H5(
+                    "Search Parameters", className="mb-0"
+                )
+            ),
+            dbc.CardBody(
+                [
+                    dbc.Row(
+                        [
+                            dbc.Col(
+                                [
+                                    html.Label(
+                                        "Search Method"
+                                    ),
+                                    dbc.Select(
+                                        id="search-method-select",
+                                        options=[
+                                            {
+                                                "label": "Text-based",
+                                                "value": "text",
+                                            },
+                                            {
+                                                "label": "Semantic",
+                                                "value": "semantic",
+                                            },
+                                            {
+                                                "label": "Hybrid",
+                                                "value": "hybrid",
+                                            },
+                                        ],
+                                        value=SEARCH_PARAM_DEFAULTS["search_method"],
+                                    ),
+                                ],
+                                width=12,
+                                md=4,
+                            ),
+                            dbc.Col(
+                                [
+                                    html.Label(
+                                        "Number of Results"
+                                    ),
+                                    dcc.Slider(
+                                        id="search-size-slider",
+                                        min=5,
+                                        max=1500,
+                                        step=5,
+                                        value=SEARCH_PARAM_DEFAULTS["size"],
+                                        marks=SIZE_MARKS,
+                                        tooltip=SLIDER_TOOLTIP,
+                                        className="mt-2",
+                                    ),
+                                ],
+                                width=12,
+                                md=4,
+                            ),
+                            dbc.Col(
+                                [
+                                    html.Label(
+                                        "Publication Year Range"
+                                    ),
+                                    dcc.RangeSlider(
+                                        id="year-range-slider",
+                                        min=1974,
+                                        max=2025,
+                                        step=1,
+                                        value=SEARCH_PARAM_DEFAULTS["year_range"],
+                                        marks=YEAR_MARKS,
+                                        tooltip=SLIDER_TOOLTIP,
+                                        className="mt-2",
+                                    ),
+                                ],
+                                width=12,
+                                md=4,
+                            ),
+                        ],
+                        className="mb-3",
+                    ),
+                    dbc.Row(
+                        [
+                            dbc.Col(
+                                [
+                                    html.Label(
+                                        "Publication Types",
+                                        className="mb-2",
+                                    ),
+                                    dcc.Dropdown(
+                                        id="publication-type-select",
+                                        options=PUBLICATION_TYPE_OPTIONS,
+                                        value=SEARCH_PARAM_DEFAULTS["pub_types"],
+                                        multi=True,
+                                        searchable=True,
+                                        clearable=False,
+                                        maxHeight=300,
+                                    ),
+                                    html.Small(
+                                        [
+                                            bi_icon("info-circle", "me-1"),
+                                            "Select multiple publication types. 'All Types' will override other selections.",
+                                        ],
+                                        className="text-muted mt-1 d-block",
+                                    ),
+                                ],
+                                width=12,
+                                className="mt-3",
+                            )
+                        ]
+                    ),
+                ]
+            ),
+        ],
+        className="mb-4 shadow-sm",
+    )
+
+
+def create_search_panel():
     return html.Div(
         [
             dbc.Row(
@@ -83,15 +229,16 @@ def create_search_panel():
                                         className="border-primary",
                                     ),
                                     dbc.InputGroupText(
-                                        html.I(
-                                            className="bi bi-question-circle text-primary",
+                                        bi_icon(
+                                            "question-circle",
+                                            "text-primary",
                                             id="search-help-icon",
                                         ),
                                         className="bg-light border-primary",
                                     ),
                                     dbc.Button(
                                         [
-                                            html.I(className="bi bi-search me-2"),
+                                            bi_icon("search"),
                                             "Search",
                                         ],
                                         id="search-button",
@@ -103,30 +250,7 @@ def create_search_panel():
                                 className="mb-3",
                             ),
                             dbc.Tooltip(
-                                [
-                                    html.P("Search tips:", className="fw-bold mb-2"),
-                                    html.Ul(
-                                        [
-                                            html.Li(
-                                                [
-                                                    html.Strong("Phrase Search: "),
-                                                    "Use quotes for exact matching in text-based search. Example: ",
-                                                    html.Code('"neural networks"'),
-                                                ]
-                                            ),
-                                            html.Li(
-                                                [
-                                                    html.Strong("Combined Search: "),
-                                                    "Mix phrases and regular terms in text-based search. Example: ",
-                                                    html.Code(
-                                                        '"machine learning" application'
-                                                    ),
-                                                ]
-                                            ),
-                                        ],
-                                        className="mb-0",
-                                    ),
-                                ],
+                                dcc.Markdown(SEARCH_TIPS, className="text-start"),
                                 target="search-help-icon",
                                 placement="bottom",
                             ),
@@ -141,9 +265,9 @@ def create_search_panel():
                         [
                             dbc.Button(
                                 [
-                                    html.I(className="bi bi-sliders me-2"),
+                                    bi_icon("sliders"),
                                     "Search Parameters",
-                                    html.I(className="bi bi-chevron-down ms-2"),
+                                    bi_icon("chevron-down", "ms-2"),
                                 ],
                                 id="search-params-button",
                                 color="secondary",
@@ -151,160 +275,14 @@ def create_search_panel():
                                 className="mb-3 w-100",
                             ),
                             dbc.Collapse(
-                                dbc.Card(
-                                    [
-                                        dbc.CardHeader(
-                                            html.H5(
-                                                "Search Parameters", className="mb-0"
-                                            )
-                                        ),
-                                        dbc.CardBody(
-                                            [
-                                                dbc.Row(
-                                                    [
-                                                        dbc.Col(
-                                                            [
-                                                                html.Label(
-                                                                    "Search Method"
-                                                                ),
-                                                                dbc.Select(
-                                                                    id="search-method-select",
-                                                                    options=[
-                                                                        {
-                                                                            "label": "Text-based",
-                                                                            "value": "text",
-                                                                        },
-                                                                        {
-                                                                            "label": "Semantic",
-                                                                            "value": "semantic",
-                                                                        },
-                                                                        {
-                                                                            "label": "Hybrid",
-                                                                            "value": "hybrid",
-                                                                        },
-                                                                    ],
-                                                                    value="hybrid",
-                                                                ),
-                                                            ],
-                                                            width=12,
-                                                            md=4,
-                                                        ),
-                                                        dbc.Col(
-                                                            [
-                                                                html.Label(
-                                                                    "Number of Results"
-                                                                ),
-                                                                dcc.Slider(
-                                                                    id="search-size-slider",
-                                                                    min=5,
-                                                                    max=1500,
-                                                                    step=5,
-                                                                    value=100,
-                                                                    marks={
-                                                                        5: "5",
-                                                                        50: "50",
-                                                                        150: "150",
-                                                                        250: "250",
-                                                                        500: "500",
-                                                                        1000: "1000",
-                                                                        1500: "1500",
-                                                                    },
-                                                                    tooltip={
-                                                                        "placement": "bottom",
-                                                                        "always_visible": True,
-                                                                    },
-                                                                    className="mt-2",
-                                                                ),
-                                                            ],
-                                                            width=12,
-                                                            md=4,
-                                                        ),
-                                                        dbc.Col(
-                                                            [
-                                                                html.Label(
-                                                                    "Publication Year Range"
-                                                                ),
-                                                                dcc.RangeSlider(
-                                                                    id="year-range-slider",
-                                                                    min=1974,
-                                                                    max=2025,
-                                                                    step=1,
-                                                                    value=[2000, 2025],
-                                                                    marks={
-                                                                        1974: "1974",
-                                                                        1980: "1980",
-                                                                        1985: "1985",
-                                                                        1990: "1990",
-                                                                        1995: "1995",
-                                                                        2000: "2000",
-                                                                        2005: "2005",
-                                                                        2010: "2010",
-                                                                        2015: "2015",
-                                                                        2020: "2020",
-                                                                        2025: "2025",
-                                                                    },
-                                                                    tooltip={
-                                                                        "placement": "bottom",
-                                                                        "always_visible": True,
-                                                                    },
-                                                                    className="mt-2",
-                                                                ),
-                                                            ],
-                                                            width=12,
-                                                            md=4,
-                                                        ),
-                                                    ],
-                                                    className="mb-3",
-                                                ),
-                                                dbc.Row(
-                                                    [
-                                                        dbc.Col(
-                                                            [
-                                                                html.Label(
-                                                                    "Publication Types",
-                                                                    className="mb-2",
-                                                                ),
-                                                                html.Div(
-                                                                    [
-                                                                        dbc.Checklist(
-                                                                            id="publication-type-select",
-                                                                            options=publication_type_options,
-                                                                            value=[
-                                                                                "all"
-                                                                            ],
-                                                                            inline=False,
-                                                                            className="publication-type-checkbox",
-                                                                        ),
-                                                                    ],
-                                                                    style={
-                                                                        "maxHeight": "300px",
-                                                                        "overflowY": "auto",
-                                                                    },
-                                                                    className="border p-3 rounded",
-                                                                ),
-                                                                html.Small(
-                                                                    [
-                                                                        html.I(
-                                                                            className="bi bi-info-circle me-1"
-                                                                        ),
-                                                                        "Select multiple publication types. 'All Types' will override other selections.",
-                                                                    ],
-                                                                    className="text-muted mt-1 d-block",
-                                                                ),
-                                                            ],
-                                                            width=12,
-                                                            className="mt-3",
-                                                        )
-                                                    ]
-                                                ),
-                                            ]
-                                        ),
-                                    ],
-                                    className="mb-4 shadow-sm",
-                                ),
+                                html.Div(id="search-params-body"),
                                 id="search-params-collapse",
                                 is_open=False,
                             ),
+                            dcc.Store(
+                                id="search-params-store",
+                                data=SEARCH_PARAM_DEFAULTS,
+                            ),
                         ],
                         width=12,
                     )
@@ -317,7 +295,7 @@ def create_search_panel():
                             html.Div(
                                 dbc.Alert(
                                     [
-                                        html.I(className="bi bi-info-circle me-2"),
+                                        bi_icon("info-circle"),
                                         "Enter a query and click Search to see results",
                                     ],
                                     color="info",
@@ -334,18 +312,51 @@ def create_search_panel():
     )
 
 
-@callback(
+SEARCH_PANEL = create_search_panel()
+
+
+clientside_callback(
+    """
+    function(selected) {
+        if (!selected || selected.length < 2 || selected.indexOf("all") < 0) {
+            return window.dash_clientside.no_update;
+        }
+        if (selected[selected.length - 1] === "all") {
+            return ["all"];
+        }
+        return selected.filter((value) => value !== "all");
+    }
+    """,
     Output("publication-type-select", "value"),
     Input("publication-type-select", "value"),
     prevent_initial_call=True,
 )
-def handle_all_types_selection(selected_values):
 
-    if "all" in selected_values and len(selected_values) > 1:
 
-        if selected_values[-1] == "all":
-            return ["all"]
+@callback(
+    Output("search-params-body", "children"),
+    Input("search-params-button", "n_clicks"),
+    State("search-params-body", "children"),
+    prevent_initial_call=True,
+)
+def mount_search_params(n_clicks, children):
+    if children:
+        return no_update
+    return create_search_params_body()
+
 
-        else:
-            return [x for x in selected_values if x != "all"]
-    return selected_values
+@callback(
+    Output("search-params-store", "data"),
+    Input("search-method-select", "value"),
+    Input("search-size-slider", "value"),
+    Input("year-range-slider", "value"),
+    Input("publication-type-select", "value"),
+    prevent_initial_call=True,
+)
+def sync_search_params(search_method, size, year_range, pub_types):
+    return {
+        "search_method": search_method,
+        "size": size,
+        "year_range": year_range,
+        "pub_types": pub_types,
+    }
@@ -1,5 +1,7 @@
 import dash_bootstrap_components as dbc
-from dash import html
+from dash import html, dcc, Patch
+from functools import lru_cache
+from components.author_link_component import create_article_author_links_for_modal
 
 
 def create_error_message(title, message, details=None):
@@ -37,21 +39,21 @@ def create_error_message(title, message, details=None):
 
 
 
+NOTIFICATION_VARIANTS = {
+    True: ("text-success", "bi bi-check-circle-fill me-2"),
+    False: ("text-danger", "bi bi-exclamation-circle-fill me-2"),
+}
+
+
 def create_notification(message, header="Notification", is_success=True):
 
-    icon = (
-        "bi bi-check-circle-fill me-2"
-        if is_success
-        else "bi bi-exclamation-circle-fill me-2"
-    )
-    color = "success" if is_success else "danger"
-    return (
-        html.Div(
-            [html.I(className=icon), html.Span(message)], className=f"text-{color}"
-        ),
-        header,
-        True,
-    )
+    color_class, icon = NOTIFICATION_VARIANTS[bool(is_success)]
+
+    notification = Patch()
+    notification["props"]["className"] = color_class
+    notification["props"]["children"][0]["props"]["className"] = icon
+    notification["props"]["children"][1]["props"]["children"] = message
+    return notification, header, True
 
 
 loading_modal = dbc.Modal(
@@ -86,6 +88,7 @@ loading_modal = dbc.Modal(
 
 
 notification_toast = dbc.Toast(
+    html.Div([html.I(), html.Span()]),
     id="notification-toast",
     header="Notification",
     is_open=False,
@@ -95,6 +98,147 @@ notification_toast = dbc.Toast(
 )
 
 
+HELP_OVERVIEW_MD = """
+##### Getting Started
+
+This system helps to find and analyze scientific publications using advanced search, clustering, and analytics capabilities.
+
+###### Main Features
+
+<ul class="list-group mb-3">
+<li class="list-group-item"><i class="bi bi-search me-2 text-primary"></i><strong>Search:</strong> Find articles using text-based, semantic, or hybrid search methods</li>
+<li class="list-group-item"><i class="bi bi-diagram-3 me-2 text-success"></i><strong>Clustering:</strong> Group similar articles to discover connections</li>
+<li class="list-group-item"><i class="bi bi-person-badge me-2 text-info"></i><strong>Authors:</strong> Explore authors and their publication networks</li>
+<li class="list-group-item"><i class="bi bi-building me-2 text-warning"></i><strong>Academic Units:</strong> Analyze publications by department and research topics across units</li>
+</ul>
+"""
+
+HELP_SEARCH_MD = """
+##### Search Options
+
+The system offers multiple search approaches to find the most relevant scientific articles.
+
+###### Search Methods
+
+<div class="card mb-3"><div class="card-body">
+<h6><i class="bi bi-fonts me-2 text-primary"></i>Text-based Search</h6>
+<p>Looks for exact word matches in articles. Best for finding specific terms or phrases.</p>
+<h6 class="mt-3"><i class="bi bi-magic me-2 text-success"></i>Semantic Search</h6>
+<p>Uses embeddings to understand the meaning behind the query. Good for finding conceptually related articles, even if they don't contain your exact search terms.</p>
+<h6 class="mt-3"><i class="bi bi-intersect me-2 text-info"></i>Hybrid Search</h6>
+<p>Combines text-based and semantic approaches for more balanced results.</p>
+</div></div>
+
+###### Filtering Options
+
+<div class="card mb-3"><div class="card-body">
+<h6>Publication Year Range</h6>
+<p class="mb-3">Limit your search to a specific time period using the year range slider.</p>
+<h6>Publication Types</h6>
+<p>Filter by specific publication types such as articles, patents, or books.</p>
+</div></div>
+
+###### Search Tips
+
+- Use specific, descriptive terms for better results
+- Try different search methods for different types of queries
+- Use filters to narrow down results by year, publication type, etc.
+- After searching, try clustering to discover topic groups
+- Use quotation marks for exact phrase matching (e.g., "machine learning")
+
+<div class="alert alert-info mt-3"><i class="bi bi-graph-up-arrow me-2 text-info"></i><strong>Visualization: </strong>Search results include interactive charts showing publication years, top keywords, and publication types.</div>
+"""
+
+HELP_CLUSTERING_MD = """
+##### Clustering Explained
+
+Clustering automatically groups similar articles together based on their content, helping to discover connections in your search results.
+
+###### Clustering Methods
+
+<ul class="list-group mb-3">
+<li class="list-group-item"><strong>Automatic: </strong>The system chooses clustering method based on your data</li>
+<li class="list-group-item"><strong>K-means: </strong>Fast algorithm that creates evenly sized clusters</li>
+<li class="list-group-item"><strong>Hierarchical: </strong>Creates a nested structure of clusters</li>
+<li class="list-group-item"><strong>HDBSCAN: </strong>Handles noise and varying density patterns in your data</li>
+</ul>
+
+###### Understanding Visualization
+
+The system provides multiple ways to visualize clusters:
+
+- **2D Scatter Plot:** Shows clusters in two-dimensional space with each point representing an article
+- **Cluster Details:** Shows publications and statistics for each cluster
+
+<div class="alert alert-info mt-3"><i class="bi bi-lightbulb-fill me-2 text-warning"></i><strong>Tips:</strong>
+<ul class="mb-0 mt-2">
+<li>Click on points in visualizations to see article details</li>
+<li>Use the cluster dropdown to explore specific clusters</li>
+<li>Look at cluster keywords to understand the focus</li>
+</ul>
+</div>
+"""
+
+HELP_AUTHORS_MD = """
+##### Author Explorer
+
+The Authors panel allows you to find and analyze scientific authors, their publications, collaboration networks, and research trends.
+
+###### Finding Authors
+
+<div class="card mb-3"><div class="card-body">
+<h6><i class="bi bi-person-badge me-2 text-primary"></i>Search by Name</h6>
+<p class="mb-3">Enter an author's name to find matching researchers. Results show basic information and publication counts.</p>
+<h6><i class="bi bi-fingerprint me-2 text-success"></i>Search by ID</h6>
+<p>You can directly access author's profile with their ID.</p>
+</div></div>
+
+###### Author Profile Features
+
+<ul class="list-group mb-3">
+<li class="list-group-item"><strong>Profile: </strong>Basic information about the author, their unit, and publication summary</li>
+<li class="list-group-item"><strong>Publications: </strong>Complete list of author's publications with details and interactive pagination</li>
+<li class="list-group-item"><strong>Co-authors: </strong>Network of researchers who have collaborated with this author</li>
+<li class="list-group-item"><strong>Analytics: </strong>Publication trends over time, common topics, and visualization of research patterns</li>
+</ul>
+
+<div class="alert alert-info mt-3"><i class="bi bi-info-circle me-2 text-info"></i><strong>Note: </strong>You can click on co-authors to view their profiles, and click on author names in article listings to quickly navigate between related researchers.</div>
+"""
+
+HELP_UNITS_MD = """
+##### Academic Units Analysis
+
+This panel enables you to explore academic departments, and analyze how different topics are researched across institutions.
+
+###### Features
+
+<div class="card mb-3"><div class="card-body">
+<h6><i class="bi bi-building me-2 text-primary"></i>Unit Search</h6>
+<p class="mb-3">Search for specific academic units to view their publications, research trends, and statistics.</p>
+<h6><i class="bi bi-diagram-3 me-2 text-success"></i>Topic Analysis</h6>
+<p>Explore how specific research topics are distributed and studied across different academic units.</p>
+</div></div>
+
+###### Visualizations
+
+- **Publication Statistics:** Year trends, publication types, and key research areas
+- **Topic Distribution:** Shows which units are most active in specific research areas
+- **Timeline Analysis:** How research topics evolve over time across different units
+- **Keyword Comparison:** Compares the focus areas between different academic units
+
+<div class="alert alert-info mt-3"><i class="bi bi-lightbulb-fill me-2 text-warning"></i><strong>Research Tip: </strong>The Topic Analysis feature is especially useful for identifying potential collaboration opportunities or finding the leading institutions in specific research areas.</div>
+"""
+
+
+HELP_TABS = (
+    (HELP_OVERVIEW_MD, "Overview", "tab-overview"),
+    (HELP_SEARCH_MD, "Search", "tab-search-help"),
+    (HELP_CLUSTERING_MD, "Clustering", "tab-clustering-help"),
+    (HELP_AUTHORS_MD, "Authors", "tab-authors-help"),
+    (HELP_UNITS_MD, "Academic Units", "tab-units-help"),
+)
+
+
 help_modal = dbc.Modal(
     [
         dbc.ModalHeader(
@@ -106,453 +250,13 @@ help_modal = dbc.Modal(
             dbc.Tabs(
                 [
                     dbc.Tab(
-                        [
-                            html.H5("Getting Started", className="mt-3 mb-3"),
-                            html.P(
-                                [
-                                    "This system helps to find and analyze scientific publications ",
-                                    "using advanced search, clustering, and analytics capabilities.",
-                                ]
-                            ),
-                            html.H6("Main Features", className="mt-4 mb-2"),
-                            dbc.ListGroup(
-                                [
-                                    dbc.ListGroupItem(
-                                        [
-                                            html.I(
-                                                className="bi bi-search me-2 text-primary"
-                                            ),
-                                            html.Strong("Search:"),
-                                            " Find articles using text-based, semantic, or hybrid search methods",
-                                        ]
-                                    ),
-                                    dbc.ListGroupItem(
-                                        [
-                                            html.I(
-                                                className="bi bi-diagram-3 me-2 text-success"
-                                            ),
-                                            html.Strong("Clustering:"),
-                                            " Group similar articles to discover connections",
-                                        ]
-                                    ),
-                                    dbc.ListGroupItem(
-                                        [
-                                            html.I(
-                                                className="bi bi-person-badge me-2 text-info"
-                                            ),
-                                            html.Strong("Authors:"),
-                                            " Explore authors and their publication networks",
-                                        ]
-                                    ),
-                                    dbc.ListGroupItem(
-                                        [
-                                            html.I(
-                                                className="bi bi-building me-2 text-warning"
-                                            ),
-                                            html.Strong("Academic Units:"),
-                                            " Analyze publications by department and research topics across units",
-                                        ]
-                                    ),
-                                ],
-                                className="mb-3",
-                            ),
-                        ],
-                        label="Overview",
-                        tab_id="tab-overview",
-                    ),
-                    dbc.Tab(
-                        [
-                            html.H5("Search Options", className="mt-3 mb-3"),
-                            html.P(
-                                [
-                                    "The system offers multiple search approaches to find ",
-                                    "the most relevant scientific articles.",
-                                ]
-                            ),
-                            html.H6("Search Methods", className="mt-3 mb-2"),
-                            dbc.Card(
-                                [
-                                    dbc.CardBody(
-                                        [
-                                            html.H6(
-                                                [
-                                                    html.I(
-                                                        className="bi bi-fonts me-2 text-primary"
-                                                    ),
-                                                    "Text-based Search",
-                                                ]
-                                            ),
-                                            html.P(
-                                                [
-                                                    "Looks for exact word matches in articles. ",
-                                                    "Best for finding specific terms or phrases.",
-                                                ]
-                                            ),
-                                            html.H6(
-                                                [
-                                                    html.I(
-                                                        className="bi bi-magic me-2 text-success"
-                                                    ),
-                                                    "Semantic Search",
-                                                ],
-                                                className="mt-3",
-                                            ),
-                                            html.P(
-                                                [
-                                                    "Uses embeddings to understand the meaning behind the query. ",
-                                                    "Good for finding conceptually related articles, even if they ",
-                                                    "don't contain your exact search terms.",
-                                                ]
-                                            ),
-                                            html.H6(
-                                                [
-                                                    html.I(
-                                                        className="bi bi-intersect me-2 text-info"
-                                                    ),
-                                                    "Hybrid Search",
-                                                ],
-                                                className="mt-3",
-                                            ),
-                                            html.P(
-                                                [
-                                                    "Combines text-based and semantic approaches for more balanced results."
-                                                ]
-                                            ),
-                                        ]
-                                    )
-                                ],
-                                className="mb-3",
-                            ),
-                            html.H6("Filtering Options", className="mt-4 mb-2"),
-                            dbc.Card(
-                                [
-                                    dbc.CardBody(
-                                        [
-                                            html.H6("Publication Year Range"),
-                                            html.P(
-                                                [
-                                                    "Limit your search to a specific time period using the year range slider."
-                                                ],
-                                                className="mb-3",
-                                            ),
-                                            html.H6("Publication Types"),
-                                            html.P(
-                                                [
-                                                    "Filter by specific publication types such as articles, patents, or books."
-                                                ]
-                                            ),
-                                        ]
-                                    )
-                                ],
-                                className="mb-3",
-                            ),
-                            html.H6("Search Tips", className="mt-4 mb-2"),
-                            html.Ul(
-                                [
-                                    html.Li(
-                                        "Use specific, descriptive terms for better results"
-                                    ),
-                                    html.Li(
-                                        "Try different search methods for different types of queries"
-                                    ),
-                                    html.Li(
-                                        "Use filters to narrow down results by year, publication type, etc."
-                                    ),
-                                    html.Li(
-                                        "After searching, try clustering to discover topic groups"
-                                    ),
-                                    html.Li(
-                                        'Use quotation marks for exact phrase matching (e.g., "machine learning")'
-                                    ),
-                                ]
-                            ),
-                            html.Div(
-                                [
-                                    html.I(
-                                        className="bi bi-graph-up-arrow me-2 text-info"
-                                    ),
-                                    html.Strong("Visualization: "),
-                                    "Search results include interactive charts showing publication years, top keywords, and publication types.",
-                                ],
-                                className="alert alert-info mt-3",
-                            ),
-                        ],
-                        label="Search",
-                        tab_id="tab-search-help",
-                    ),
-                    dbc.Tab(
-                        [
-                            html.H5("Clustering Explained", className="mt-3 mb-3"),
-                            html.P(
-                                [
-                                    "Clustering automatically groups similar articles together based on their ",
-                                    "content, helping to discover connections in your search results.",
-                                ]
-                            ),
-                            html.H6("Clustering Methods", className="mt-3 mb-2"),
-                            dbc.ListGroup(
-                                [
-                                    dbc.ListGroupItem(
-                                        [
-                                            html.Strong("Automatic: "),
-                                            "The system chooses clustering method based on your data",
-                                        ]
-                                    ),
-                                    dbc.ListGroupItem(
-                                        [
-                                            html.Strong("K-means: "),
-                                            "Fast algorithm that creates evenly sized clusters",
-                                        ]
-                                    ),
-                                    dbc.ListGroupItem(
-                                        [
-                                            html.Strong("Hierarchical: "),
-                                            "Creates a nested structure of clusters",
-                                        ]
-                                    ),
-                                    dbc.ListGroupItem(
-                                        [
-                                            html.Strong("HDBSCAN: "),
-                                            "Handles noise and varying density patterns in your data",
-                                        ]
-                                    ),
-                                ],
-                                className="mb-3",
-                            ),
-                            html.H6(
-                                "Understanding Visualization", className="mt-4 mb-2"
-                            ),
-                            html.P(
-                                [
-                                    "The system provides multiple ways to visualize clusters:"
-                                ]
-                            ),
-                            html.Ul(
-                                [
-                                    html.Li(
-                                        [
-                                            html.Strong("2D Scatter Plot: "),
-                                            "Shows clusters in two-dimensional space with each point representing an article",
-                                        ]
-                                    ),
-                                    html.Li(
-                                        [
-                                            html.Strong("Cluster Details: "),
-                                            "Shows publications and statistics for each cluster",
-                                        ]
-                                    ),
-                                ]
-                            ),
-                            html.Div(
-                                [
-                                    html.I(
-                                        className="bi bi-lightbulb-fill me-2 text-warning"
-                                    ),
-                                    html.Strong("Tips:"),
-                                    html.Ul(
-                                        [
-                                            html.Li(
-                                                "Click on points in visualizations to see article details"
-                                            ),
-                                            html.Li(
-                                                "Use the cluster dropdown to explore specific clusters"
-                                            ),
-                                            html.Li(
-                                                "Look at cluster keywords to understand the focus"
-                                            ),
-                                        ],
-                                        className="mb-0 mt-2",
-                                    ),
-                                ],
-                                className="alert alert-info mt-3",
-                            ),
-                        ],
-                        label="Clustering",
-                        tab_id="tab-clustering-help",
-                    ),
-                    dbc.Tab(
-                        [
-                            html.H5("Author Explorer", className="mt-3 mb-3"),
-                            html.P(
-                                [
-                                    "The Authors panel allows you to find and analyze scientific authors, ",
-                                    "their publications, collaboration networks, and research trends.",
-                                ]
-                            ),
-                            html.H6("Finding Authors", className="mt-3 mb-2"),
-                            dbc.Card(
-                                [
-                                    dbc.CardBody(
-                                        [
-                                            html.H6(
-                                                [
-                                                    html.I(
-                                                        className="bi bi-person-badge me-2 text-primary"
-                                                    ),
-                                                    "Search by Name",
-                                                ]
-                                            ),
-                                            html.P(
-                                                [
-                                                    "Enter an author's name to find matching researchers. ",
-                                                    "Results show basic information and publication counts.",
-                                                ],
-                                                className="mb-3",
-                                            ),
-                                            html.H6(
-                                                [
-                                                    html.I(
-                                                        className="bi bi-fingerprint me-2 text-success"
-                                                    ),
-                                                    "Search by ID",
-                                                ]
-                                            ),
-                                            html.P(
-                                                [
-                                                    "You can directly access author's profile with their ID."
-                                                ]
-                                            ),
-                                        ]
-                                    )
-                                ],
-                                className="mb-3",
-                            ),
-                            html.H6("Author Profile Features", className="mt-4 mb-2"),
-                            dbc.ListGroup(
-                                [
-                                    dbc.ListGroupItem(
-                                        [
-                                            html.Strong("Profile: "),
-                                            "Basic information about the author, their unit, and publication summary",
-                                        ]
-                                    ),
-                                    dbc.ListGroupItem(
-                                        [
-                                            html.Strong("Publications: "),
-                                            "Complete list of author's publications with details and interactive pagination",
-                                        ]
-                                    ),
-                                    dbc.ListGroupItem(
-                                        [
-                                            html.Strong("Co-authors: "),
-                                            "Network of researchers who have collaborated with this author",
-                                        ]
-                                    ),
-                                    dbc.ListGroupItem(
-                                        [
-                                            html.Strong("Analytics: "),
-                                            "Publication trends over time, common topics, and visualization of research patterns",
-                                        ]
-                                    ),
-                                ],
-                                className="mb-3",
-                            ),
-                            html.Div(
-                                [
-                                    html.I(
-                                        className="bi bi-info-circle me-2 text-info"
-                                    ),
-                                    html.Strong("Note: "),
-                                    "You can click on co-authors to view their profiles, and click on author names in article listings to quickly navigate between related researchers.",
-                                ],
-                                className="alert alert-info mt-3",
-                            ),
-                        ],
-                        label="Authors",
-                        tab_id="tab-authors-help",
-                    ),
-                    dbc.Tab(
-                        [
-                            html.H5("Academic Units Analysis", className="mt-3 mb-3"),
-                            html.P(
-                                [
-                                    "This panel enables you to explore academic departments,",
-                                    "and analyze how different topics are researched across institutions.",
-                                ]
-                            ),
-                            html.H6("Features", className="mt-3 mb-2"),
-                            dbc.Card(
-                                [
-                                    dbc.CardBody(
-                                        [
-                                            html.H6(
-                                                [
-                                                    html.I(
-                                                        className="bi bi-building me-2 text-primary"
-                                                    ),
-                                                    "Unit Search",
-                                                ]
-                                            ),
-                                            html.P(
-                                                [
-                                                    "Search for specific academic units to view their publications, ",
-                                                    "research trends, and statistics.",
-                                                ],
-                                                className="mb-3",
-                                            ),
-                                            html.H6(
-                                                [
-                                                    html.I(
-                                                        className="bi bi-diagram-3 me-2 text-success"
-                                                    ),
-                                                    "Topic Analysis",
-                                                ]
-                                            ),
-                                            html.P(
-                                                [
-                                                    "Explore how specific research topics are distributed and studied ",
-                                                    "across different academic units.",
-                                                ]
-                                            ),
-                                        ]
-                                    )
-                                ],
-                                className="mb-3",
-                            ),
-                            html.H6("Visualizations", className="mt-4 mb-2"),
-                            html.Ul(
-                                [
-                                    html.Li(
-                                        [
-                                            html.Strong("Publication Statistics: "),
-                                            "Year trends, publication types, and key research areas",
-                                        ]
-                                    ),
-                                    html.Li(
-                                        [
-                                            html.Strong("Topic Distribution: "),
-                                            "Shows which units are most active in specific research areas",
-                                        ]
-                                    ),
-                                    html.Li(
-                                        [
-                                            html.Strong("Timeline Analysis: "),
-                                            "How research topics evolve over time across different units",
-                                        ]
-                                    ),
-                                    html.Li(
-                                        [
-                                            html.Strong("Keyword Comparison: "),
-                                            "Compares the focus areas between different academic units",
-                                        ]
-                                    ),
-                                ]
-                            ),
-                            html.Div(
-                                [
-                                    html.I(
-                                        className="bi bi-lightbulb-fill me-2 text-warning"
-                                    ),
-                                    html.Strong("Research Tip: "),
-                                    "The Topic Analysis feature is especially useful for identifying potential ",
-                                    "collaboration opportunities or finding the leading institutions in specific research areas.",
-                                ],
-                                className="alert alert-info mt-3",
-                            ),
-                        ],
-                        label="Academic Units",
-                        tab_id="tab-units-help",
-                    ),
+                        dcc.Markdown(
+                            text, dangerously_allow_html=True, className="mt-3"
+                        ),
+                        label=label,
+                        tab_id=tab_id,
+                    )
+                    for text, label, tab_id in HELP_TABS
                 ]
             ),
         ),
@@ -596,25 +300,53 @@ article_detail_modal = dbc.Modal(
 
 def create_article_detail_content(article_data):
 
-    from dash import html
-    import dash_bootstrap_components as dbc
-
-    from components.author_link_component import create_article_author_links_for_modal
-
     if not article_data:
         return html.Div("Brak danych artykułu.")
 
-    abstract = article_data.get("abstract", "Brak abstraktu.")
-    publication_year = article_data.get("publication_year", "Nieznany")
-    publication_type = article_data.get("publication_type", "Nieznany")
-    keywords = article_data.get("keywords", [])
+    keywords = article_data.get("keywords") or []
     authors = article_data.get("authors", [])
-    url = article_data.get("url", "")
 
     if isinstance(keywords, str):
         keywords = [keywords]
+    if isinstance(authors, str):
+        authors = [authors]
+
+    # Author links are rebuilt on every call so a failed name lookup is not
+    # cached along with the static metadata.
+    details, link = build_article_detail_sections(
+        article_data.get("abstract", "Brak abstraktu."),
+        article_data.get("publication_year", "Nieznany"),
+        article_data.get("publication_type", "Nieznany"),
+        ", ".join(map(str, keywords)),
+        article_data.get("url", ""),
+    )
+
+    return html.Div([*details, create_article_authors_row(authors), *link])
+
+
+def create_article_authors_row(authors):
+    return dbc.Row(
+        [
+            dbc.Col(
+                [
+                    html.H5("Autorzy", className="mb-2"),
+                    create_article_author_links_for_modal(
+                        list(authors), className="d-flex flex-wrap"
+                    ),
+                ],
+                width=12,
+            ),
+        ],
+        className="mb-3",
+    )
+
+
+@lru_cache(maxsize=512)
+def build_article_detail_sections(
+    abstract, publication_year, publication_type, keywords_text, url
+):
 
-    content = [
+    details = (
         dbc.Row(
             [
                 dbc.Col(
@@ -642,7 +374,7 @@ def create_article_detail_content(article_data):
                         html.Div(
                             [
                                 html.Span("Słowa kluczowe: ", className="fw-bold"),
-                                html.Span(", ".join(keywords) if keywords else "Brak"),
+                                html.Span(keywords_text or "Brak"),
                             ],
                             className="mb-2",
                         ),
@@ -665,24 +397,11 @@ def create_article_detail_content(article_data):
             ],
             className="mb-3",
         ),
-        dbc.Row(
-            [
-                dbc.Col(
-                    [
-                        html.H5("Autorzy", className="mb-2"),
-                        create_article_author_links_for_modal(
-                            authors, className="d-flex flex-wrap"
-                        ),
-                    ],
-                    width=12,
-                ),
-            ],
-            className="mb-3",
-        ),
-    ]
+    )
 
+    link = ()
     if url:
-        content.append(
+        link = (
             dbc.Row(
                 [
                     dbc.Col(
@@ -699,7 +418,7 @@ def create_article_detail_content(article_data):
                         className="text-center",
                     ),
                 ]
-            )
+            ),
         )
 
-    return html.Div(content)
+    return details, link
@@ -576,6 +576,66 @@ def test_author_publications(mock_search, mock_search_service):
     assert len(data["publications"]) > 0
 
 
+@pytest.mark.api
+@patch("backend.app.search_service")
+def test_author_publications_lite(mock_search, mock_search_service):
+    mock_search.get_author_publications.return_value = (
+        mock_search_service.get_author_publications.return_value
+    )
+
+    response = client.post(
+        "/api/author_publications",
+        json={"author_id": "001106", "size": 0, "lite": True},
+    )
+
+    assert response.status_code == 200
+    mock_search.get_author_publications.assert_called_once_with(
+        author_id="001106", size=None, from_=0, filters=None, lite=True
+    )
+
+
+@pytest.mark.api
+@patch("backend.app.search_service")
+def test_author_publications_page(mock_search):
+    mock_search.get_author_publications_page.return_value = {
+        "hits": [{"id": "art1"}, {"id": "art2"}],
+        "total": 5,
+        "next_cursor": "token-2",
+    }
+
+    response = client.get(
+        "/api/author_publications",
+        params={"author_id": "001106", "cursor": "token-1", "size": 2},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["publications"]) == 2
+    assert data["total"] == 5
+    assert data["next_cursor"] == "token-2"
+    mock_search.get_author_publications_page.assert_called_once_with(
+        author_id="001106", size=2, cursor="token-1", lite=True
+    )
+
+    mock_search.get_author_publications_page.return_value = {
+        "hits": [{"id": "art5"}],
+        "total": 5,
+        "next_cursor": None,
+    }
+    response = client.get(
+        "/api/author_publications",
+        params={"author_id": "001106", "cursor": "token-2", "size": 2},
+    )
+    assert response.json()["next_cursor"] is None
+
+    mock_search.get_author_publications_page.side_effect = RuntimeError("es down")
+    response = client.get(
+        "/api/author_publications",
+        params={"author_id": "001106", "size": 2},
+    )
+    assert response.status_code == 500
+
+
 @pytest.mark.api
 @patch("backend.app.search_service")
 @patch("backend.app.es_service")
@@ -595,6 +655,35 @@ def test_author_coauthors(mock_es, mock_search, mock_search_service, mock_es_ser
     assert "author_id" in data
 
 
+@pytest.mark.api
+@patch("backend.app.search_service")
+@patch("backend.app.es_service")
+def test_author_coauthors_single_mget(mock_es, mock_search):
+    mock_search.get_author_publications.return_value = [
+        {"id": "art1", "authors": ["001106", "002707"]},
+        {"id": "art2", "authors": ["001106", "003301"]},
+    ]
+
+    mget_response = MagicMock()
+    mget_response.status_code = 200
+    mget_response.json.return_value = {
+        "docs": [
+            {"_id": "002707", "found": True, "_source": {"id": "002707", "full_name": "Szwed Henryk"}},
+            {"_id": "003301", "found": False},
+        ]
+    }
+    mock_es.session.post.return_value = mget_response
+
+    response = client.post("/api/author_coauthors", json={"author_id": "001106"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 1
+    assert data["coauthors"][0]["full_name"] == "Szwed Henryk"
+    mock_es.session.post.assert_called_once()
+    mock_es.session.get.assert_not_called()
+
+
 @pytest.mark.api
 @patch("backend.app.es_service")
 def test_authors_bulk(mock_es, mock_es_service):